@@ -1,5 +1,7 @@
 from typing import Callable, TYPE_CHECKING
 
+from .models import Area, CardType, ChallengeIcon, ConstantAbilityType, FacedownCard
+
 if TYPE_CHECKING:
     from .engine import GameEngine
     from .models import Card
@@ -59,7 +61,6 @@ class CampaignGuide:
     Returns whether or not the SOURCE_CARD was discarded as part of the campaign guide entry resolution
     """
     def resolve_entry(self, entry_number: str, source_card: 'Card | None', engine: 'GameEngine', clear_type: str | None) -> bool:
-        from .models import ConstantAbilityType
         actual_entry_number = entry_number
         if "." not in entry_number:
             for ability in engine.get_constant_abilities_by_type(ConstantAbilityType.OVERRIDE_CAMPAIGN_ENTRY):
@@ -105,7 +106,6 @@ class CampaignGuide:
         engine.add_message("--- Instruction ---")
         engine.add_message("Put the Lone Tree Station location into play in the surroundings.")
         from .decks import get_location_by_id
-        from .models import Area
         engine.state.location = get_location_by_id("Lone Tree Station")
         engine.state.areas[Area.SURROUNDINGS].append(engine.state.location)
         #skip calling enters_play on Lone Tree Station; we resolve its campaign guide entry later and it has no
@@ -257,7 +257,6 @@ class CampaignGuide:
         biscuit_delivery = source_card
         biscuit_basket = biscuit_delivery.flip(engine)
         engine.add_message("Then choose a Ranger to equip it. (Only one ranger; automatically chosen)")
-        from .models import Area
         engine.move_card(biscuit_basket.id, Area.PLAYER_AREA)
         engine.enforce_equip_limit()
 
@@ -466,7 +465,6 @@ class CampaignGuide:
             _, msg = source_card.remove_progress(source_card.progress)
             engine.add_message(msg)
             from .cards import HelpingHand
-            from .models import Area
             helping_hand = HelpingHand()
             engine.state.areas[Area.SURROUNDINGS].append(helping_hand)
             helping_hand.enters_play(engine, Area.SURROUNDINGS, source_card)
@@ -481,7 +479,6 @@ class CampaignGuide:
 
     def _discard_flora_from(self, source_card: 'Card', engine: 'GameEngine') -> None:
         """Helper: discard each flora attached facedown to a card."""
-        from .models import FacedownCard
         for attached_id in list(source_card.attached_card_ids):
             attached_card = engine.state.get_card_by_id(attached_id)
             if (attached_card and 
@@ -679,7 +676,6 @@ class CampaignGuide:
         return False
     
     def resolve_entry_80_4(self, _source_card: 'Card | None', engine: 'GameEngine', _clear_type: str | None) -> bool:
-        from .models import ChallengeIcon
         engine.add_message("== Campaign Guide Entry 80.4 ==")
         engine.add_message("")
         engine.add_message("--- Story ---")
@@ -851,7 +847,6 @@ class CampaignGuide:
         engine.add_message("")
         engine.add_message("--- Action ---")
         engine.add_message("Exhaust one non-human being in play.")
-        from .models import CardType
         non_human_beings = [c for c in engine.state.all_cards_in_play()
                             if c.has_type(CardType.BEING) and not c.has_trait("Human") and c.is_ready()]
         if non_human_beings:
@@ -897,7 +892,6 @@ class CampaignGuide:
             engine.add_message(msg)
             # Attach Helping Hand
             from .cards import HelpingHand
-            from .models import Area
             helping_hand = HelpingHand()
             engine.state.areas[Area.SURROUNDINGS].append(helping_hand)
             helping_hand.enters_play(engine, Area.SURROUNDINGS, source_card)
@@ -1001,7 +995,6 @@ class CampaignGuide:
 
     def _resolve_entry_86_clear_choice(self, source_card: 'Card | None', engine: 'GameEngine') -> bool:
         """Shared A/B choice logic for 86.3 and 86.4."""
-        from .models import Area
         engine.add_message("")
         engine.add_message("--- RANGERS CHOOSE: ---")
         engine.add_message('A) Have him stay and continue helping you. Discard all [tokens] from the Fundamentalist, and move him.')
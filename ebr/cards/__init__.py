@@ -23,7 +23,6 @@ __all__ = ["WalkWithMe",
             "SunberryBramble",
             "SitkaDoe",
             "ProwlingWolhund",
-            "SitkaBuck",
             "CausticMulcher",
             "CalypsaRangerMentor",
             "PeerlessPathfinder",
@@ -8,14 +8,15 @@ from ..json_loader import load_card_fields #type:ignore
 
 
 class ADearFriend(Card):
+    art_description = "Two figures stand facing the horizon, with an arm each on each other's backs. " \
+    "The figure on the right is fully colored and detailed, with slick black hair tied in a bushy ponytail, goggles, " \
+    "a red-orange billowing cloak, and their gloved hand pointing out into the distance. The figure on the left, " \
+    "along with the background landscape, are rendered as greyscale sketches. The figure on the left has goggles, a bladed staff, " \
+    "and a shoulder bag, each also a greyscale sketch."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("A Dear Friend", "Conciliator")) #type:ignore
-        self.art_description = "Two figures stand facing the horizon, with an arm each on each other's backs. " \
-        "The figure on the right is fully colored and detailed, with slick black hair tied in a bushy ponytail, goggles, " \
-        "a red-orange billowing cloak, and their gloved hand pointing out into the distance. The figure on the left, " \
-        "along with the background landscape, are rendered as greyscale sketches. The figure on the left has goggles, a bladed staff, " \
-        "and a shoulder bag, each also a greyscale sketch."
     
     def get_play_targets(self, state: GameState) -> list[Card] | None:
         return [card for card in (state.path_deck + state.path_discard) if card.has_trait("human")]
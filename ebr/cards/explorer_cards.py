@@ -6,14 +6,15 @@ from ..engine import GameEngine
 from ..json_loader import load_card_fields #type:ignore
 
 class PeerlessPathfinder(Card):
+    art_description = "A dark-skinned ranger squints off into the distance, shielding his eyes " \
+    "from a late afternoon sun with his left arm. He carries a walking stick carved from a gnarled branch " \
+    "with his other arm, and three sharp throwing spears jut out of his backpack, atop which a device " \
+    "which may be a collapsed Orlin Hiking Stave is strapped. He wears a thick cap with earmuffs that " \
+    "hides all his hair, and heavy-duty goggles are strapped above the cap's brim. His cloak is reinforced " \
+    "with metal around his shoulders."
+
     def __init__(self):
         super().__init__(**load_card_fields("Peerless Pathfinder", "Explorer")) #type:ignore
-        self.art_description = "A dark-skinned ranger squints off into the distance, shielding his eyes " \
-        "from a late afternoon sun with his left arm. He carries a walking stick carved from a gnarled branch " \
-        "with his other arm, and three sharp throwing spears jut out of his backpack, atop which a device " \
-        "which may be a collapsed Orlin Hiking Stave is strapped. He wears a thick cap with earmuffs that " \
-        "hides all his hair, and heavy-duty goggles are strapped above the cap's brim. His cloak is reinforced " \
-        "with metal around his shoulders."
     
     def get_exhaust_abilities(self) -> list[Action] | None:
         """Exhaust: Move ranger token to feature, that feature fatigues you"""
@@ -52,13 +53,14 @@ class PeerlessPathfinder(Card):
             engine.state.ranger.fatigue(engine, presence)
 
 class ShareintheValleysSecrets(Card):
+    art_description = "A sketch depicting the silouetted figures of three rangers " \
+    "traversing a series of raised pillars in an overgrown landscape. The leftmost figure is mid-leap from " \
+    "on pillar to another, the middle figure seems poised to do the same, and the rightmost figure is carefully " \
+    "lowering themselves across a drop between two closer pillars."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("Share in the Valley's Secrets", "Explorer")) #type:ignore
-        self.art_description = "A sketch depicting the silouetted figures of three rangers " \
-        "traversing a series of raised pillars in an overgrown landscape. The leftmost figure is mid-leap from " \
-        "on pillar to another, the middle figure seems poised to do the same, and the rightmost figure is carefully " \
-        "lowering themselves across a drop between two closer pillars."
 
     def resolve_moment_effect(self, engine: GameEngine, effort: int, target: Card | None) -> None:
         """Exhaust each obstacle. Suffer fatigue equal to the number of obstacles exhausted this way."""
@@ -74,15 +76,16 @@ class ShareintheValleysSecrets(Card):
         
 
 class BoundarySensor(Card):
+    art_description = "A gloved hand grips the lower half of a roughly cylindrical handheld device, " \
+    "about 8 inches in length. The gripped portion is only barely visible through the hand's fingers, and " \
+    "appears to be a simple grip point of smooth black material, perhaps rubber. The upper portion extends " \
+    "out through the hand's thumb and index finger wrapped around the grip, and consists of intricate metal parts " \
+    "and lights, with some exposed circuitry showing through. Topping the device is a transluscent red half-dome " \
+    "through which a gathering miniature antennae is darkly visible."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("Boundary Sensor", "Explorer")) #type:ignore
-        self.art_description = "A gloved hand grips the lower half of a roughly cylindrical handheld device, " \
-        "about 8 inches in length. The gripped portion is only barely visible through the hand's fingers, and " \
-        "appears to be a simple grip point of smooth black material, perhaps rubber. The upper portion extends " \
-        "out through the hand's thumb and index finger wrapped around the grip, and consists of intricate metal parts " \
-        "and lights, with some exposed circuitry showing through. Topping the device is a transluscent red half-dome " \
-        "through which a gathering miniature antennae is darkly visible."
 
     def get_listeners(self) -> list[EventListener] | None:
         return [EventListener(event_type=EventType.PERFORM_TEST,
@@ -103,14 +106,15 @@ class BoundarySensor(Card):
             return 0
         
 class AffordedByNature(Card):
+    art_description = "A sketch of a ranger and an animal in conflict. The ranger is " \
+    "backed up against the tip of a steep rocky outcropping, and seems to have just kicked " \
+    "out and triggered a minor rockslide. The animal, perhaps a wolhund or atrox, is caught " \
+    "up in the falling rocks and flung out and away from the slope, limbs flailing and fangs " \
+    "bared as it falls helplessly."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("Afforded by Nature", "Explorer")) #type:ignore
-        self.art_description = "A sketch of a ranger and an animal in conflict. The ranger is " \
-        "backed up against the tip of a steep rocky outcropping, and seems to have just kicked " \
-        "out and triggered a minor rockslide. The animal, perhaps a wolhund or atrox, is caught " \
-        "up in the falling rocks and flung out and away from the slope, limbs flailing and fangs " \
-        "bared as it falls helplessly."
     
     def get_play_targets(self, state: GameState) -> list[Card] | None:
         return state.get_in_play_cards_by_trait("trail")
@@ -135,12 +139,13 @@ class AffordedByNature(Card):
 
 
 class WalkWithMe(Card):
+    art_description = "A sketch of a canine in a snowy, hilly clearing. The canine looks " \
+    "back, and in the distance you see the small figures of the rest of its pack just exiting a copse " \
+    "of snow-topped firs."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("Walk With Me", "Explorer")) #type:ignore
-        self.art_description = "A sketch of a canine in a snowy, hilly clearing. The canine looks " \
-        "back, and in the distance you see the small figures of the rest of its pack just exiting a copse " \
-        "of snow-topped firs."
     
     def get_listeners(self) -> list[EventListener] | None:
         def trigger_play_prompt(eng: GameEngine, effort: int) -> int:
@@ -166,16 +171,17 @@ class WalkWithMe(Card):
         
     
 class CradledbytheEarth(Card):
+    art_description = "A sketch depicting three figures framed by two moderately-sized trees. " \
+    "The foremost figure lies peacefully at rest across the frame, his head towards the left and his " \
+    "legs extending off-frame towards the right. We see he's smiling, his wide-brimmed hat providing him shade, " \
+    "and a butterfly pearching at that brim's tip. The next foremost figure is also lying in rest, his back " \
+    "propped up against the right-hand tree, his hands folded in front of him in his lap. Finally, we see a figure " \
+    "in the background oriented towards the distance, but their head turned back to observe their two resting " \
+    "companions."
+
     def __init__(self):
         # Load all common RangerCard fields from JSON
         super().__init__(**load_card_fields("Cradled by the Earth", "Explorer")) #type:ignore
-        self.art_description = "A sketch depicting three figures framed by two moderately-sized trees. " \
-        "The foremost figure lies peacefully at rest across the frame, his head towards the left and his " \
-        "legs extending off-frame towards the right. We see he's smiling, his wide-brimmed hat providing him shade, " \
-        "and a butterfly pearching at that brim's tip. The next foremost figure is also lying in rest, his back " \
-        "propped up against the right-hand tree, his hands folded in front of him in his lap. Finally, we see a figure " \
-        "in the background oriented towards the distance, but their head turned back to observe their two resting " \
-        "companions."
     
     def get_play_targets(self, state: GameState) -> list[Card] | None:
         return state.get_in_play_cards_by_trait("trail")
@@ -9,13 +9,14 @@ from ..engine import GameEngine
 
 
 class CerberusianCyclone(Card):
+    art_description = (
+        "A trio of violently spinning columns of air tears across the landscape, "
+        "kicking up dust and debris and uprooting small trees. The funnels fuse into "
+        "a massive vortex at their base."
+    )
+
     def __init__(self):
         super().__init__(**load_card_fields("Cerberusian Cyclone", "general"))  # type:ignore
-        self.art_description = (
-            "A trio of violently spinning columns of air tears across the landscape, "
-            "kicking up dust and debris and uprooting small trees. The funnels fuse into "
-            "a massive vortex at their base."
-        )
 
     def get_tests(self) -> list[Action]:
         """AWA + [conflict]: Evade [2] the violently swirling columns of air to discard 1 strength
@@ -27,8 +28,8 @@ class CerberusianCyclone(Card):
                 aspect=Aspect.AWA,
                 approach=Approach.CONFLICT,
                 verb="Evade",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_evade_success,
                 source_id=self.id,
                 source_title=self.title,
@@ -49,7 +50,8 @@ class CerberusianCyclone(Card):
             engine.add_message(f"No strength remaining on {self.title} - discarding it!")
             self.discard_from_play(engine)
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect,
             ChallengeIcon.CREST: self._crest_effect,
@@ -98,12 +100,13 @@ class CerberusianCyclone(Card):
 
 
 class BallLightning(Card):
+    art_description = (
+        "A crackling sphere of bright electrical energy flits through the trees, "
+        "swirling with intense pale-blue volatility. It leaves a wispy blue trail behind it as it moves."
+    )
+
     def __init__(self):
         super().__init__(**load_card_fields("Ball Lightning", "general"))  # type:ignore
-        self.art_description = (
-            "A crackling sphere of bright electrical energy flits through the trees, "
-            "swirling with intense pale-blue volatility. It leaves a wispy blue trail behind it as it moves."
-        )
 
     def on_harm_clear(self, engine: GameEngine):
         """Clear [harm]: If within reach of a Ranger, suffer 2 injuries.
@@ -121,7 +124,8 @@ class BallLightning(Card):
             else:
                 engine.add_message("Ball Lightning was cleared by harm while along the way! (Location has no progress to remove.)")
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
             ChallengeIcon.CREST: self._crest_effect,
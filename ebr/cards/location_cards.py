@@ -11,14 +11,15 @@ from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
 
 class LoneTreeStation(Card):
+    art_description = "A towering tree straddles much of a grassy plateau, standing " \
+    "as tall as a skyscraper and several times as wide. A few buildings dot its surroundings, " \
+    "some a small distance away and others ensconsced by its enormous roots. Some structures " \
+    "are visible in its branches, including large hanging planters the size of rooms and balconies " \
+    "carved out from the trunk."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Lone Tree Station", "Locations")) #type:ignore
-        self.art_description = "A towering tree straddles much of a grassy plateau, standing " \
-        "as tall as a skyscraper and several times as wide. A few buildings dot its surroundings, " \
-        "some a small distance away and others ensconsced by its enormous roots. Some structures " \
-        "are visible in its branches, including large hanging planters the size of rooms and balconies " \
-        "carved out from the trunk."
 
     def do_arrival_setup(self, engine: GameEngine) -> None:
         engine.add_message(f"Search the path deck for the next predator and discard it.")
@@ -44,15 +45,16 @@ class LoneTreeStation(Card):
 
 
 class AncestorsGrove(Card):
+    art_description = "A small clearing within the dense wood, showered by sunbeams " \
+    "that pour in through the thick canopy above. Several structures dot the clearing, " \
+    "each consisting of two parts: the lower part a dome the size and shape of an igloo, " \
+    "but built with stone, earth, and wood; and the upper part a copse of trees growing " \
+    "atop the dome, their roots snaking down over the grassy roof of the dome. Several people " \
+    "gather around the entrance to the closest dome, each wearing hooded robes of a different color."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Ancestor's Grove", "Locations")) #type:ignore
-        self.art_description = "A small clearing within the dense wood, showered by sunbeams " \
-        "that pour in through the thick canopy above. Several structures dot the clearing, " \
-        "each consisting of two parts: the lower part a dome the size and shape of an igloo, " \
-        "but built with stone, earth, and wood; and the upper part a copse of trees growing " \
-        "atop the dome, their roots snaking down over the grassy roof of the dome. Several people " \
-        "gather around the entrance to the closest dome, each wearing hooded robes of a different color."
 
     def do_arrival_setup(self, engine: GameEngine) -> None:
         engine.add_message(f"Search the path deck for the next card with a presence of 3 and discard it.")
@@ -85,7 +87,7 @@ class AncestorsGrove(Card):
         engine.add_message(f"Next Ranger: Search the path deck for the next prey and put it into play. (Skipped)")
 
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
@@ -104,11 +106,12 @@ class AncestorsGrove(Card):
             return False
     
 class BoulderField(Card):
+    art_description = "A wide-open field filled with boulders of all shapes and sizes. " \
+    "The skull of a horned being - perhaps a Sitka Buck? - lies in the center of the scene."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Boulder Field", "Locations")) #type:ignore
-        self.art_description = "A wide-open field filled with boulders of all shapes and sizes. " \
-        "The skull of a horned being - perhaps a Sitka Buck? - lies in the center of the scene."
 
 
     def do_arrival_setup(self, engine: GameEngine) -> None:
@@ -11,13 +11,14 @@ from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
 
 class HyPimpotChef(Card):
+    art_description = "A heavy-set man with a friendly smile and droopy eyes. His face almost resembles " \
+    "a walrus's, the edges of his lips curled upward towards rounded cheeks in an affable manner. He wears a simple " \
+    "detached hood with a brim over his head and ears, a thick padded jacket, and a belt pouch slung over his torso " \
+    "filled with plucked herbs and vials of ingredients."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Hy Pimpot, Chef", "Lone Tree Station")) #type:ignore
-        self.art_description = "A heavy-set man with a friendly smile and droopy eyes. His face almost resembles " \
-        "a walrus's, the edges of his lips curled upward towards rounded cheeks in an affable manner. He wears a simple " \
-        "detached hood with a brim over his head and ears, a thick padded jacket, and a belt pouch slung over his torso " \
-        "filled with plucked herbs and vials of ingredients."
 
     def get_tests(self) -> list[Action]:
         """AWA + [reason]: Harvest [2] local plants for the stew to attach a flora facedown to Hy.
@@ -30,7 +31,7 @@ class HyPimpotChef(Card):
                 approach=Approach.REASON,
                 verb="Harvest",
                 target_provider=lambda s: [card for card in s.all_cards_in_play() if card.has_trait("Flora")],
-                difficulty_fn=lambda _s, _t: 2,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_harvest_success,
                 source_id=self.id,
                 source_title=self.title,
@@ -53,7 +54,7 @@ class HyPimpotChef(Card):
             engine.add_message(f"{self.title} has 3 flora attached! He prepares his famous stew.")
             engine.campaign_guide.resolve_entry("47.4", self, engine, None)
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Crest: If there is an active predator, exhaust it. Add harm to this being equal to that predator's presence."""
         return {
             ChallengeIcon.CREST: self._crest_effect
@@ -11,6 +11,8 @@ from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
 
 class BiscuitDelivery(Card):
+    double_sided = True
+
     def __init__(self, fresh: bool = True): #"fresh" flag to prevent infinite recursion
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Biscuit Delivery", "Mission")) #type:ignore
@@ -51,7 +53,7 @@ class BiscuitDelivery(Card):
                                 override_entry = "91",
                                 modifier=None)]
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
@@ -90,10 +92,12 @@ class HelpingHand(Card):
             engine.add_message(f"{action_target.title} gains Persistent from Helping Hand.")
 
 class BiscuitBasket(Card):
+    double_sided = True
+
     def __init__(self, fresh: bool = True): #"fresh" flag to prevent infinite recursion
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Biscuit Basket", "Mission")) #type:ignore
-        self.card_types.add(CardType.RANGER)
+        self.card_types = self.card_types | {CardType.RANGER}
         if fresh:
             self.backside = BiscuitDelivery(fresh=False)
             self.backside.backside = self
@@ -127,7 +131,7 @@ class BiscuitBasket(Card):
                 approach=Approach.CONNECTION,
                 verb="Give",
                 target_provider=lambda s: [human for human in s.get_in_play_cards_by_trait("Human") if human.unique_tokens.get("biscuit") is None],
-                difficulty_fn=lambda _s, _t: 2,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_give_success,
                 on_fail=None,
                 source_id=self.id,
@@ -140,7 +144,7 @@ class BiscuitBasket(Card):
                 approach=Approach.REASON,
                 verb="Sneak",
                 target_provider=None,
-                difficulty_fn=lambda _s, _t: 1,
+                difficulty_fn=fixed_difficulty(1),
                 on_success=self._on_sneak_success,
                 on_fail=None,
                 source_id=self.id,
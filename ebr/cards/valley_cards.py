@@ -3,26 +3,24 @@ Valley set card implementations
 """
 from typing import Callable
 
-from ebr.models import EventListener
-
-
 from ..models import *
 from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
 
 class CalypsaRangerMentor(Card):
+    art_description = "A mature woman with determined eyes, wearing a form-fitting " \
+    "suit of what almost looks like padded armor, a hooded cloak, a backpack, and a " \
+    "Ranger Badge. The suit is clearly thick enough to offer substantial protection, but her " \
+    "body's musclature and strength is apparent beneath its surface, with muscled arms and a " \
+    "broad chest. She carries a simple walking stick shaped like a shepherd's crook, " \
+    "reinforced by a wrapping around the grip point and what might be bone ornamentation along its hook."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Calypsa, Ranger Mentor", "Valley")) #type:ignore
-        self.art_description = "A mature woman with determined eyes, wearing a form-fitting " \
-        "suit of what almost looks like padded armor, a hooded cloak, a backpack, and a " \
-        "Ranger Badge. The suit is clearly thick enough to offer substantial protection, but her " \
-        "body's musclature and strength is apparent beneath its surface, with muscled arms and a " \
-        "broad chest. She carries a simple walking stick shaped like a shepherd's crook, " \
-        "reinforced by a wrapping around the grip point and what might be bone ornamentation along its hook."
 
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect,
@@ -45,39 +43,36 @@ class CalypsaRangerMentor(Card):
     
 
 class QuisiVosRascal(Card):
+    art_description = "A young girl with a bright smile frolics among several butterfly-like " \
+    "beings, her right arm bouncing happily and her left arm outstretched towards one of the beings, " \
+    "her wide eyes fixed on it with awe. She wears a simple green cloak with some reinforcement around " \
+    "the shoulders, a lightly striped scarf, and a brown shoulder bag. One of the beings is perched on her " \
+    "left index finger, which is actually part of an entirely mechanical prosthetic left hand. The palm and " \
+    "each finger float detached from the prosthetic wrist, seemingly held in coordination by some kind of magnetic " \
+    "force-field technology."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Quisi Vos, Rascal", "Valley")) #type:ignore
-        self.art_description = "A young girl with a bright smile frolics among several butterfly-like " \
-        "beings, her right arm bouncing happily and her left arm outstretched towards one of the beings, " \
-        "her wide eyes fixed on it with awe. She wears a simple green cloak with some reinforcement around " \
-        "the shoulders, a lightly striped scarf, and a brown shoulder bag. One of the beings is perched on her " \
-        "left index finger, which is actually part of an entirely mechanical prosthetic left hand. The palm and " \
-        "each finger float detached from the prosthetic wrist, seemingly held in coordination by some kind of magnetic " \
-        "force-field technology."
         
 
-    def get_listeners(self) -> list[EventListener] | None:
-        listeners = super().get_listeners()
-        return listeners
-    
     def get_tests(self) -> list[Action]:
         """FOC + [connection]: Ask Quisi about her adventures in the Valley to add [progress]
         to this being equal to your effort. Then exhaust this being. [Campaign Log Entry] 80.4"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-ask-{self.id}",
                 name=f"{self.title} (FOC + Connection) [1]",
                 aspect=Aspect.FOC,
                 approach=Approach.CONNECTION,
                 verb="Ask",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 1,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(1),
                 on_success=self._on_ask_success,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_ask_success(self, engine: GameEngine, effort: int, _card: Card | None) -> None:
         """Add progress equal to effort, exhaust Quisi, resolve entry 80.4."""
@@ -87,7 +82,7 @@ class QuisiVosRascal(Card):
         engine.add_message(f"{self.title} is exhausted.")
         engine.campaign_guide.resolve_entry("80.4", self, engine, None)
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
@@ -97,9 +92,9 @@ class QuisiVosRascal(Card):
     def _sun_effect(self, engine: GameEngine) -> bool:
         """Sun effect: Discard either 1 progress or 1 token from a flora, insect, or gear."""
         # Find valid targets: flora, insect, or gear with at least one token (progress or unique)
-        targets: list[Card] = [target for target in engine.state.all_cards_in_play()
-                   if (target.has_trait("Flora") or target.has_trait("Insect") or target.has_type(CardType.GEAR))
-                   and (target.progress > 0 or target.has_any_unique_tokens())]
+        candidates = engine.state.get_in_play_cards_by_traits_or_types(["Flora", "Insect"], [CardType.GEAR])
+        targets: list[Card] = [target for target in candidates
+                               if target.progress > 0 or target.has_any_unique_tokens()]
         if targets:
             engine.add_message(f"Challenge (Sun) on {self.title}: Quisi discards a token from a flora, insect, or gear. Choose one:")
             target = engine.card_chooser(engine, targets)
@@ -137,40 +132,42 @@ class QuisiVosRascal(Card):
         return self.harm_from_predator(engine, ChallengeIcon.CREST, self)
     
 class TalaTheRedExile(Card):
+    art_description = (
+        "A woman with broad shoulders and muscles rippling through her arms and neck. " \
+        "Her hair is a dark brownish-red, tied into dense cornrows that bundle into a bushy " \
+        "ponytail. She wears a fur-trimmed parka that appears to have been cut down into a sort " \
+        "of vest, with its fluffy insulation visible around the interior of the collar. A pocketed " \
+        "belt pouch is slung around her shoulder and chest, and she rests an enormous, serrated ice-pick " \
+        "on her shoulder."
+    )
+
     def __init__(self):
         super().__init__(**load_card_fields("Tala the Red, Exile", "Valley")) #type:ignore
-        self.art_description = (
-            "A woman with broad shoulders and muscles rippling through her arms and neck. " \
-            "Her hair is a dark brownish-red, tied into dense cornrows that bundle into a bushy " \
-            "ponytail. She wears a fur-trimmed parka that appears to have been cut down into a sort " \
-            "of vest, with its fluffy insulation visible around the interior of the collar. A pocketed " \
-            "belt pouch is slung around her shoulder and chest, and she rests an enormous, serrated ice-pick " \
-            "on her shoulder."
-        )
 
     def get_tests(self) -> list[Action]:
         """SPI + [conflict]: Prevent [2] Tala from intimidating the wildlife to exhaust this being."""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-prevent-{self.id}",
                 name=f"{self.title} (SPI + Conflict) [2]",
                 aspect=Aspect.SPI,
                 approach=Approach.CONFLICT,
                 verb="Prevent",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_prevent_success,
                 on_fail=None,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_prevent_success(self, engine: GameEngine, effort: int, _card: Card | None) -> None:
         """Exhaust this being."""
         engine.add_message(self.exhaust())
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect,
             ChallengeIcon.CREST: self._crest_effect,
@@ -202,16 +199,17 @@ class TalaTheRedExile(Card):
 
 
 class TheFundamentalist(Card):
+    art_description = "A tensed-up man turns to look at you, his shoulders slightly hunched and his right arm " \
+    "clenched upwards. His face is almost entirely obscured by a heavy-duty set of goggles over his eyes and nose and " \
+    "the enormous collar of his coat covering his mouth, cheeks, and chin. He wears a wide-brimmed conical hat in teal, " \
+    "the same color as his coat and gloves; you get the sense that barely any of his body is exposed to the elements. His " \
+    "backpack is unusual, resembling a tiered miniature garden strapped to his back, rimmed by what could be earthenware " \
+    "or stone. All sorts of plants sprout out into the open air; you count at least a dozen varieties, ranging from flowering " \
+    "cacti to spindly mushrooms to leafy bushels and ferns."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("The Fundamentalist", "Valley")) #type:ignore
-        self.art_description = "A tensed-up man turns to look at you, his shoulders slightly hunched and his right arm " \
-        "clenched upwards. His face is almost entirely obscured by a heavy-duty set of goggles over his eyes and nose and " \
-        "the enormous collar of his coat covering his mouth, cheeks, and chin. He wears a wide-brimmed conical hat in teal, " \
-        "the same color as his coat and gloves; you get the sense that barely any of his body is exposed to the elements. His " \
-        "backpack is unusual, resembling a tiered miniature garden strapped to his back, rimmed by what could be earthenware " \
-        "or stone. All sorts of plants sprout out into the open air; you count at least a dozen varieties, ranging from flowering " \
-        "cacti to spindly mushrooms to leafy bushels and ferns."
         
 
     def get_constant_abilities(self) -> list[ConstantAbility] | None:
@@ -226,7 +224,7 @@ class TheFundamentalist(Card):
                                                         amount = -1,
                                                         source_id=self.id))] + (results if results is not None else [])
     
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect,
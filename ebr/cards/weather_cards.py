@@ -9,20 +9,29 @@ from ..models import *
 from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
 
+
+def _always_active(_engine: GameEngine, _card: Card | None) -> bool:
+    """Shared `active` check for weather refresh listeners, which always fire"""
+    return True
+
+
 class APerfectDay(Card):
+    art_description = "A gentle pair of streams runs amongst a small gathering " \
+    "of stylized trees, joining together in the distance. The sun just peeks out over " \
+    "the treetops amidst a clear blue sky, flanked by a smattering of thinning clouds."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True): #"fresh" flag to prevent infinite recursion
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("A Perfect Day", "Weather")) #type:ignore
-        self.art_description = "A gentle pair of streams runs amongst a small gathering " \
-        "of stylized trees, joining together in the distance. The sun just peeks out over " \
-        "the treetops amidst a clear blue sky, flanked by a smattering of thinning clouds."
         if fresh:
             self.backside = MiddaySun(fresh=False)
             self.backside.backside = self
 
 
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect
@@ -41,12 +50,12 @@ class APerfectDay(Card):
 
 
     def get_listeners(self) -> list[EventListener] | None:
-        return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
-                              self._tick_down_clouds,
-                              self.id,
-                              TimingType.WHEN
-                              )]
+        return self._cached_listeners(lambda: [EventListener(EventType.REFRESH,
+                                         _always_active,
+                                         self._tick_down_clouds,
+                                         self.id,
+                                         TimingType.WHEN
+                                         )])
 
     def _tick_down_clouds(self, engine: GameEngine, effort: int) -> int:
         self.remove_unique_tokens(engine, "Cloud", 1)
@@ -62,16 +71,19 @@ class APerfectDay(Card):
 
 
 class MiddaySun(Card):
+    art_description = "The sun blazes high above mountain peaks, sending tendrils of heat " \
+    "snaking through a sky coated with heat-haze."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True): #"fresh" flag to prevent infinite recursion
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Midday Sun", "Weather")) #type:ignore
-        self.art_description = "The sun blazes high above mountain peaks, sending tendrils of heat " \
-        "snaking through a sky coated with heat-haze."
         if fresh:
             self.backside = APerfectDay(fresh=False)
             self.backside.backside = self
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
@@ -85,21 +97,21 @@ class MiddaySun(Card):
 
     def get_tests(self) -> list[Action]:
         """Returns all tests this card provides"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-{self.id}",
                 name=f"{self.title} (FOC + Reason) [2]",
                 aspect=Aspect.FOC,
                 approach=Approach.REASON,
                 verb="Locate",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_locate_success,
                 on_fail=None,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_locate_success(self, engine: GameEngine, _effort: int, _target: Card | None) -> None:
         self.add_unique_tokens(engine, "Cloud", 1)
@@ -108,12 +120,12 @@ class MiddaySun(Card):
 
 
     def get_listeners(self) -> list[EventListener] | None:
-        return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
-                              self._tick_up_clouds,
-                              self.id,
-                              TimingType.WHEN
-                              )]
+        return self._cached_listeners(lambda: [EventListener(EventType.REFRESH,
+                                         _always_active,
+                                         self._tick_up_clouds,
+                                         self.id,
+                                         TimingType.WHEN
+                                         )])
 
     def _tick_up_clouds(self, engine: GameEngine, effort: int) -> int:
         self.add_unique_tokens(engine, "Cloud", 1)
@@ -133,9 +145,12 @@ class Downpour(Card):
 
     Sun challenge: Discard 1 rain. Each ranger suffers 1 fatigue.
     If no rain remaining, flip into Gathering Storm."""
+    art_description = "A thick gathering of clouds hangs over a lone tree. Sheets of rain cover the sky and earth."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Downpour", "Weather")) #type:ignore
-        self.art_description = "A thick gathering of clouds hangs over a lone tree. Sheets of rain cover the sky and earth."
         if fresh:
             self.backside = GatheringStorm(fresh=False)
             self.backside.backside = self
@@ -146,7 +161,8 @@ class Downpour(Card):
             raise RuntimeError(f"Weather should always have a backside!")
         engine.state.weather = self.backside
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
         }
@@ -168,9 +184,12 @@ class GatheringStorm(Card):
 
     Test: FOC + Reason: Shelter [2] to discard 1 rain for every 2 effort.
     Refresh: Add 2 rain. At 4+, move all prey to along the way, exhaust role, flip into Downpour."""
+    art_description = "Wispy clouds over a mountain peak are forming into a dense and ominous shape."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Gathering Storm", "Weather")) #type:ignore
-        self.art_description = "Wispy clouds over a mountain peak are forming into a dense and ominous shape." 
         if fresh:
             self.backside = Downpour(fresh=False)
             self.backside.backside = self
@@ -189,8 +208,8 @@ class GatheringStorm(Card):
                 aspect=Aspect.FOC,
                 approach=Approach.REASON,
                 verb="Shelter",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_shelter_success,
                 on_fail=None,
                 source_id=self.id,
@@ -209,7 +228,7 @@ class GatheringStorm(Card):
 
     def get_listeners(self) -> list[EventListener] | None:
         return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
+                              _always_active,
                               self._refresh_effect,
                               self.id,
                               TimingType.WHEN
@@ -239,9 +258,12 @@ class HowlingWinds(Card):
     Arrival Setup: Shuffle a Cerberusian Cyclone into the path deck.
     Refresh: If 3+ wind, remove them, draw 1 extra path next round, flip into Thunderhead.
     Sun challenge: Add 2 wind. May suffer up to 2 fatigue to add 1 fewer wind per fatigue."""
+    art_description = "The sun and distance peaks are only barely visible now as violent gusts tear down from cloudy skies."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Howling Winds", "Weather")) #type:ignore
-        self.art_description = "The sun and distance peaks are only barely visible now as violent gusts tear down from cloudy skies." 
         self._extra_path_draw_pending = False
         if fresh:
             self.backside = Thunderhead(fresh=False)
@@ -262,7 +284,8 @@ class HowlingWinds(Card):
         engine.add_message(f"Howling Winds: No Cerberusian Cyclone available in the collection.")
         return []
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
         }
@@ -285,7 +308,7 @@ class HowlingWinds(Card):
 
     def get_listeners(self) -> list[EventListener] | None:
         return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
+                              _always_active,
                               self._refresh_effect,
                               self.id,
                               TimingType.WHEN
@@ -317,9 +340,12 @@ class Thunderhead(Card):
     Refresh: Flip into Howling Winds.
     Sun challenge: Remove 1 progress from each path card and the location.
     Crest challenge: Ready 1 predator or prey."""
+    art_description = "From dark clouds towering impossibly high, a peal of thunder strikes."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Thunderhead", "Weather")) #type:ignore
-        self.art_description = "From dark clouds towering impossibly high, a peal of thunder strikes."
         if fresh:
             self.backside = HowlingWinds(fresh=False)
             self.backside.backside = self
@@ -330,7 +356,8 @@ class Thunderhead(Card):
             raise RuntimeError(f"Weather should always have a backside!")
         engine.state.weather = self.backside
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
             ChallengeIcon.CREST: self._crest_effect,
@@ -364,7 +391,7 @@ class Thunderhead(Card):
 
     def get_listeners(self) -> list[EventListener] | None:
         return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
+                              _always_active,
                               self._refresh_effect,
                               self.id,
                               TimingType.WHEN
@@ -385,9 +412,12 @@ class ElectricFog(Card):
               If you fail, suffer 1 injury.
     Sun challenge: Discard 1 fog. Each ranger suffers 1 fatigue. If no fog remaining,
                    flip into Clinging Mist."""
+    art_description = "Nothing is visible except fog all around you and increasingly frequent sparks of electricity."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Electric Fog", "Weather")) #type:ignore
-        self.art_description = "Nothing is visible except fog all around you and increasingly frequent sparks of electricity." 
         self._fog_used_this_test = False
         if fresh:
             self.backside = ClingingMist(fresh=False)
@@ -408,7 +438,8 @@ class ElectricFog(Card):
         engine.add_message(f"Electric Fog: No Ball Lightning available in the collection.")
         return []
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
         }
@@ -479,9 +510,12 @@ class ClingingMist(Card):
     Constant: Increase the difficulty of all tests by 1.
     Refresh: Add 2 fog. If 4+ fog, flip into Electric Fog.
     Sun challenge: Discard 1 energy."""
+    art_description = "Tendrils of mist blanket the floor of the valley, with only the very peaks of tall trees poking out over the sea of fog."
+
+    double_sided = True
+
     def __init__(self, fresh: bool = True):
         super().__init__(**load_card_fields("Clinging Mist", "Weather")) #type:ignore
-        self.art_description = "Tendrils of mist blanket the floor of the valley, with only the very peaks of tall trees poking out over the sea of fog."
         if fresh:
             self.backside = ElectricFog(fresh=False)
             self.backside.backside = self
@@ -501,7 +535,8 @@ class ClingingMist(Card):
             modifier=ValueModifier(target="difficulty", amount=1, source_id=self.id)
         )]
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
+        """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect
         }
@@ -525,7 +560,7 @@ class ClingingMist(Card):
 
     def get_listeners(self) -> list[EventListener] | None:
         return [EventListener(EventType.REFRESH,
-                              lambda eng, _c: True,
+                              _always_active,
                               self._refresh_effect,
                               self.id,
                               TimingType.WHEN
@@ -3,7 +3,6 @@ Woods terrain set card implementations
 """
 from typing import Callable
 
-from ebr.models import Area, ConstantAbility
 from ..models import *
 from ..json_loader import load_card_fields #type:ignore
 from ..engine import GameEngine
@@ -11,23 +10,26 @@ from ..engine import GameEngine
 
 
 class ProwlingWolhund(Card):
+    art_description = "A tense canine being with a distinct mane running from its " \
+    "forehead all the way down to join its tail. It steps lightly on the balls of its " \
+    "paws, oriented slightly away from you but with its head turned to give you a glare."
+
     def __init__(self):
         super().__init__(**load_card_fields("Prowling Wolhund", "woods")) #type:ignore
-        self.art_description = "A tense canine being with a distinct mane running from its " \
-        "forehead all the way down to join its tail. It steps lightly on the balls of its " \
-        "paws, oriented slightly away from you but with its head turned to give you a glare."
     
     def enters_play(self, engine: GameEngine, area: Area, action_target: Card | None = None) -> None:
         """If there is another predator in play, this predator comes into play exhausted"""
         super().enters_play(engine, area, action_target)
-        predators = engine.state.get_in_play_cards_by_trait("Predator")
+        predators = engine.state.count_in_play_cards_by_trait("Predator")
         # Check if there's another predator besides this one
-        if predators and any(p.id != self.id for p in predators):
+        if self.id in engine.state.get_in_play_index().order:
+            predators -= 1
+        if predators > 0:
             self.exhaust()
             engine.add_message("   Another predator is present - Prowling Wolhund enters play exhausted.")
         
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
@@ -69,17 +71,18 @@ class ProwlingWolhund(Card):
             return False
 
 class SitkaBuck(Card):
+    art_description = "A deer-like being stands tall and alert in the woods. Its " \
+    "neck is nearly as long as the rest of its body, and coated in an extra-thick layer of " \
+    "bushy fur. Its snout resembles a cow's. Its antlers are multi-pronged and symmetrical, " \
+    "with both branching in many directions in both smooth curves and sharp angles. If it " \
+    "charged antlers-forward, those sharp points would hurt."
+
 
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Sitka Buck", "woods")) #type:ignore
-        self.art_description = "A deer-like being stands tall and alert in the woods. Its " \
-        "neck is nearly as long as the rest of its body, and coated in an extra-thick layer of " \
-        "bushy fur. Its snout resembles a cow's. Its antlers are multi-pronged and symmetrical, " \
-        "with both branching in many directions in both smooth curves and sharp angles. If it " \
-        "charged antlers-forward, those sharp points would hurt."
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
@@ -91,35 +94,31 @@ class SitkaBuck(Card):
         """If there is another active Sitka Buck, exhaust this being >> Add 2[harm] to both this
         and the other Sitka Buck."""
         self_display_id = engine.get_display_id_cached(self)
-        bucks = engine.state.get_in_play_cards_by_title("Sitka Buck")
-        if not bucks:
-            raise RuntimeError("This card should count itself as a buck, so we can't get no-bucks-found here.")
-        else:
-            other_active_bucks = [buck for buck in bucks if buck.id != self.id and buck.is_ready()]
-            if other_active_bucks:
-                if len(other_active_bucks)==1:
-                    engine.add_message(f"Challenge (Sun) on {self_display_id}: Only one other active buck; automatically chosen for harm:")
-                else:
-                    engine.add_message(f"Challenge (Sun) on {self_display_id}: Choose another buck to harm:")
-                target_buck = engine.card_chooser(engine, other_active_bucks)
-                engine.add_message(self.exhaust())
-                engine.add_message(self.add_harm(2))
-                engine.add_message(target_buck.add_harm(2))
-                return True
+        other_active_bucks = [buck for buck in engine.state.get_ready_in_play_cards_by_title("Sitka Buck")
+                              if buck.id != self.id]
+        if other_active_bucks:
+            if len(other_active_bucks)==1:
+                engine.add_message(f"Challenge (Sun) on {self_display_id}: Only one other active buck; automatically chosen for harm:")
             else:
-                engine.add_message(f"Challenge (Sun) on {self_display_id}: (no other active Sitka Bucks)")
-                return False
+                engine.add_message(f"Challenge (Sun) on {self_display_id}: Choose another buck to harm:")
+            target_buck = engine.card_chooser(engine, other_active_bucks)
+            engine.add_message(self.exhaust())
+            engine.add_message(self.add_harm(2))
+            engine.add_message(target_buck.add_harm(2))
+            return True
+        else:
+            engine.add_message(f"Challenge (Sun) on {self_display_id}: (no other active Sitka Bucks)")
+            return False
     
     def _mountain_effect(self, engine: GameEngine) -> bool:
         """If there is an active predator, exhaust it >> Add 2 harm to it, then add harm to this
         being equal to that predator's presence."""
         self_display_id = engine.get_display_id_cached(self)
-        predators = engine.state.get_in_play_cards_by_trait("Predator")
-        if not predators:
+        if not engine.state.count_in_play_cards_by_trait("Predator"):
             engine.add_message(f"Challenge (Mountain) on {self_display_id}: (no predators in play)")
             return False
         else:
-            active_predators = [predator for predator in predators if predator.is_ready()]
+            active_predators = engine.state.get_ready_in_play_cards_by_trait("Predator")
             if not active_predators:
                 engine.add_message(f"Challenge (Mountain) on {self_display_id}: (no active predators in play)")
                 return False
@@ -140,8 +139,7 @@ class SitkaBuck(Card):
     def _crest_effect(self, engine: GameEngine) -> bool:
         """If there is an active Sitka Doe, the buck charges >> Suffer 1 injury."""
         self_display_id = engine.get_display_id_cached(self)
-        does = engine.state.get_in_play_cards_by_title("Sitka Doe")
-        if does and any(doe.is_ready() for doe in does):
+        if engine.state.get_ready_in_play_cards_by_title("Sitka Doe"):
             engine.add_message(f"Challenge (Crest) on {self_display_id}: There is an active Sitka Doe, so the buck charges.")
             engine.state.ranger.injure(engine)
             return True
@@ -150,35 +148,36 @@ class SitkaBuck(Card):
             return False
 
 class SitkaDoe(Card):
+    art_description = "A deer-like being looking closely at a low bush. Its neck is " \
+    "nearly as long as the rest of its body, and coated in an extra-thick layer of bushy fur. " \
+    "Its snout resembles a cow's. It lacks antlers, and it's not clear whether it's noticed you."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Sitka Doe", "woods")) #type:ignore
-        self.art_description = "A deer-like being looking closely at a low bush. Its neck is " \
-        "nearly as long as the rest of its body, and coated in an extra-thick layer of bushy fur. " \
-        "Its snout resembles a cow's. It lacks antlers, and it's not clear whether it's noticed you."
 
     def get_tests(self) -> list[Action]:
         """Returns all tests this card provides"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-{self.id}",
                 name=f"{self.title} (SPI + Conflict) [X=presence]",
                 aspect=Aspect.SPI,
                 approach=Approach.CONFLICT,
                 verb="Spook",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 1,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(1),
                 on_success=self._on_spook_success,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_spook_success(self, engine: GameEngine, effort: int, card: Card | None) -> None:
         """Spook test success: move to Along the Way"""
         engine.move_card(self.id, Area.ALONG_THE_WAY)
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
@@ -194,11 +193,7 @@ class SitkaDoe(Card):
             return False
         else:
             engine.add_message(f"Challenge (Sun) on {self_display_id}: The Sitka Buck are drawn to the doe. They move within reach.")
-            any_moved = False
-            for buck in bucks:
-                if engine.move_card(buck.id, Area.WITHIN_REACH):
-                    any_moved = True
-            return any_moved
+            return bool(engine.move_cards([buck.id for buck in bucks], Area.WITHIN_REACH))
             
 
     def _mountain_effect(self, engine: GameEngine) -> bool:
@@ -206,15 +201,16 @@ class SitkaDoe(Card):
         return self.harm_from_predator(engine, ChallengeIcon.MOUNTAIN, self)
 
 class CausticMulcher(Card):
+    art_description = "A large, many-limbed being that stands at least 10 feet tall, nearly " \
+    "brushing up against the boughs of the wood's trees. Its main body resembles a bulb or a pod " \
+    "with a rocky texture along its surface, topped with a circular maw ringed with sharp talon-like " \
+    "teeth. Extending from the center of its maw is a prehensile tentacle-tube, with a ring of " \
+    "grabber-claws at the end of it. You count at least 8 legs extending haphazardly from just below " \
+    "the maw, each with two joints along its length. They're coated in exoskeleton, like a spider's."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Caustic Mulcher", "woods")) #type:ignore
-        self.art_description = "A large, many-limbed being that stands at least 10 feet tall, nearly " \
-        "brushing up against the boughs of the wood's trees. Its main body resembles a bulb or a pod " \
-        "with a rocky texture along its surface, topped with a circular maw ringed with sharp talon-like " \
-        "teeth. Extending from the center of its maw is a prehensile tentacle-tube, with a ring of " \
-        "grabber-claws at the end of it. You count at least 8 legs extending haphazardly from just below " \
-        "the maw, each with two joints along its length. They're coated in exoskeleton, like a spider's."
     
     def enters_play(self, engine: GameEngine, area: Area, action_target: Card | None = None) -> None:
         super().enters_play(engine, area, action_target)
@@ -249,21 +245,21 @@ class CausticMulcher(Card):
 
     def get_tests(self) -> list[Action]:
         """Returns all tests this card provides"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-{self.id}",
                 name=f"{self.title} (FIT + Conflict) [2]",
                 aspect=Aspect.FIT,
                 approach=Approach.CONFLICT,
                 verb="Wrest",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_wrest_success,
                 on_fail=None,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_wrest_success(self, engine: GameEngine, effort: int, card: Card | None) -> None:
         """Wrest test success: exhaust this biomeld, then remove a ranger token or unattach a being from it"""
@@ -296,7 +292,7 @@ class CausticMulcher(Card):
 
         
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.SUN: self._sun_effect,
@@ -339,32 +335,33 @@ class CausticMulcher(Card):
         return resolved
 
 class SunberryBramble(Card):
+    art_description = "A clearing full of bulging, juicy-looking, bright-yellow fruit. " \
+    "Each of the fruit has a vertical ring of thorns around its circumference, and a bundle " \
+    "of stamen extending up from the top of the fruit shrouded by 5 dropping leaves. Extending " \
+    "down from the fruits is a thick stem with even thicker horn-like thorns. Woody vines climb up " \
+    "from the earth, wrapping around the stems."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Sunberry Bramble", "woods")) #type:ignore
-        self.art_description = "A clearing full of bulging, juicy-looking, bright-yellow fruit. " \
-        "Each of the fruit has a vertical ring of thorns around its circumference, and a bundle " \
-        "of stamen extending up from the top of the fruit shrouded by 5 dropping leaves. Extending " \
-        "down from the fruits is a thick stem with even thicker horn-like thorns. Woody vines climb up " \
-        "from the earth, wrapping around the stems."
 
     def get_tests(self) -> list[Action]:
         """Returns all tests this card provides"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-{self.id}",
                 name=f"{self.title} (AWA + Reason) [2]",
                 aspect=Aspect.AWA,
                 approach=Approach.REASON,
                 verb="Pluck",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 2,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(2),
                 on_success=self._on_pluck_success,
                 on_fail=self._fail_effect,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_pluck_success(self, engine: GameEngine, _effort: int, _card: Card | None) -> None:
         """Pluck test success: add 1 harm"""
@@ -379,7 +376,7 @@ class SunberryBramble(Card):
             engine.state.ranger.fatigue(engine, curr_presence)
 
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect
@@ -396,38 +393,36 @@ class SunberryBramble(Card):
 
 
 class OvergrownThicket(Card):
+    art_description = "The trees before you have grown thick and tangled, forming " \
+    "a nearly impenetrable barrier in your path."
+
     def __init__(self):
         # Load all common PathCard fields from JSON
         super().__init__(**load_card_fields("Overgrown Thicket", "woods")) #type:ignore
-        self.art_description = "The trees before you have grown thick and tangled, forming " \
-        "a nearly impenetrable barrier in your path."
 
-    def get_constant_abilities(self) -> list[ConstantAbility] | None:
-        return super().get_constant_abilities()
-    
     def get_tests(self) -> list[Action] | None:
         """Returns all tests this card provides"""
-        return [
+        return self._cached_tests(lambda: [
             Action(
                 id=f"test-{self.id}",
                 name=f"{self.title} (AWA + Exploration)",
                 aspect=Aspect.AWA,
                 approach=Approach.EXPLORATION,
                 verb="Hunt",
-                target_provider=lambda _s: [self],
-                difficulty_fn=lambda _s, _t: 1,
+                target_provider=self.target_self,
+                difficulty_fn=fixed_difficulty(1),
                 on_success=self._on_hunt_success,
                 source_id=self.id,
                 source_title=self.title,
             )
-        ]
+        ])
 
     def _on_hunt_success(self, engine: GameEngine, effort: int, card: Card | None) -> None:
         """Hunt test success: add progress equal to effort"""
         msg = self.add_progress(effort)
         engine.add_message(msg)
 
-    def get_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]]:
         """Returns challenge symbol effects for this card"""
         return {
             ChallengeIcon.MOUNTAIN: self._mountain_effect
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from .models import Card
+from .models import Card, Mission
 
 
 def build_woods_path_deck() -> list[Card]:
@@ -28,39 +28,37 @@ def get_pivotal_cards(location: Card) -> list[Card]:
     else:
         raise RuntimeError("Pivotal location not yet implemented; can't fetch Pivotal set!")
 
+_LOCATION_REGISTRY: dict[str, type[Card]] | None = None
+
+
+def _get_location_registry() -> dict[str, type[Card]]:
+    """Location title -> card class, built on first use"""
+    global _LOCATION_REGISTRY
+    if _LOCATION_REGISTRY is None:
+        # Import inside function to avoid circular import
+        from .cards import BoulderField, AncestorsGrove, LoneTreeStation
+        _LOCATION_REGISTRY = {
+            "Lone Tree Station": LoneTreeStation,
+            "Boulder Field": BoulderField,
+            "Ancestor's Grove": AncestorsGrove,
+        }
+    return _LOCATION_REGISTRY
+
 def get_available_travel_destinations(current_location: Card) -> list[Card]:
     """Return the available travel destinations from the current location.
 
     Currently implements a triangle of three locations:
     Lone Tree Station <-> Boulder Field <-> Ancestor's Grove <-> Lone Tree Station
     """
-    # Import inside function to avoid circular import
-    from .cards import BoulderField, AncestorsGrove, LoneTreeStation
-
-    # All three locations form a connected triangle
-    all_locations = {
-        "Lone Tree Station": LoneTreeStation,
-        "Boulder Field": BoulderField,
-        "Ancestor's Grove": AncestorsGrove,
-    }
-
-    # Return all locations except the current one
-    return [loc_class() for title, loc_class in all_locations.items()
+    # All three locations form a connected triangle, so return all locations except the current one
+    return [loc_class() for title, loc_class in _get_location_registry().items()
             if title != current_location.title]
 
 def get_location_by_id(location_id: str) -> Card:
     """Get a location card by its ID. Returns Lone Tree Station as default if unknown."""
-    # Import inside function to avoid circular import
-    from .cards import BoulderField, AncestorsGrove, LoneTreeStation
-
-    location_registry = {
-        "Boulder Field": BoulderField,
-        "Ancestor's Grove": AncestorsGrove,
-        "Lone Tree Station": LoneTreeStation
-    }
-
-    if location_id in location_registry:
-        return location_registry[location_id]()
+    location_class = _get_location_registry().get(location_id)
+    if location_class is not None:
+        return location_class()
     else:
         raise ValueError(f"Unknown location ID: '{location_id}'")
 
@@ -79,7 +77,6 @@ def get_current_weather(weather_title: str) -> Card:
         raise RuntimeError(f"Weather not found: {weather_title}")
 
 
-from .models import Mission
 def get_current_missions(active_missions: list[Mission]) -> list[Card]:
     from .cards import BiscuitDelivery
 
@@ -1,18 +1,37 @@
 from __future__ import annotations
+import copy
 import random
 from dataclasses import dataclass
-from typing import Callable, Optional, Any, cast
+from typing import Callable, Iterable, Optional, Any, cast
 from .models import (
     GameState, Action, CommitDecision, RangerState, Card, FacedownCard, ChallengeIcon,
     Aspect, Approach, Area, CardType, EventType, TimingType, EventListener,
-    MessageEvent, Keyword, ConstantAbility, ConstantAbilityType, CampaignTracker
+    MessageEvent, Keyword, ConstantAbility, ConstantAbilityType, CampaignTracker, DayEndException
 )
-from .utils import get_display_id
-from .decks import get_current_weather, get_current_missions
+from .decks import get_current_weather, get_current_missions, get_available_travel_destinations, get_location_by_id
 from .campaign_guide import CampaignGuide
+from .utils import remove_by_identity
+
+# Order in which Step 5 resolves challenge effects, area by area
+_CHALLENGE_AREA_ORDER: tuple[Area, ...] = (
+    Area.SURROUNDINGS,     # Weather, Location, Mission
+    Area.ALONG_THE_WAY,
+    Area.WITHIN_REACH,
+    Area.PLAYER_AREA,
+)
+
+# Areas searched for the closest ready Obstacle, nearest first
+_OBSTACLE_SEARCH_ORDER: tuple[Area, ...] = (Area.WITHIN_REACH, Area.ALONG_THE_WAY, Area.SURROUNDINGS)
+
+# Areas that can still be interacted with when the closest ready Obstacle is in the key area
+_AREAS_UP_TO_OBSTACLE: dict[Area, frozenset[Area]] = {
+    Area.WITHIN_REACH: frozenset({Area.PLAYER_AREA, Area.WITHIN_REACH}),
+    Area.ALONG_THE_WAY: frozenset({Area.PLAYER_AREA, Area.WITHIN_REACH, Area.ALONG_THE_WAY}),
+    Area.SURROUNDINGS: frozenset({Area.PLAYER_AREA, Area.WITHIN_REACH, Area.ALONG_THE_WAY, Area.SURROUNDINGS}),
+}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChallengeOutcome:
     modifier: int
     symbol: ChallengeIcon
@@ -20,6 +39,10 @@ class ChallengeOutcome:
     success: bool
 
 
+# Shared result for non-test actions (e.g. Rest), which skip the challenge entirely
+_NO_TEST_OUTCOME = ChallengeOutcome(modifier=0, symbol=ChallengeIcon.SUN, resulting_effort=0, success=True)
+
+
 
 
 class GameEngine:
@@ -47,8 +70,16 @@ class GameEngine:
         self.amount_chooser = amount_chooser if amount_chooser is not None else self._default_amount_chooser
         # Event listeners and message queue (game engine concerns, not board state)
         self.listeners: list[EventListener] = []
+        # Same listeners bucketed by (event, timing) in registration order, for dispatch
+        self._listeners_by_event: dict[tuple[EventType, TimingType], list[EventListener]] = {}
+        # ...and by source card id, so discards can drop a card's listeners without a scan
+        self._listeners_by_source: dict[str, list[EventListener]] = {}
         self.constant_abilities: list[ConstantAbility] = []
+        # Same abilities bucketed by type in registration order, for the per-type queries
+        self._constant_abilities_by_type: dict[ConstantAbilityType, list[ConstantAbility]] = {}
         self.message_queue: list[MessageEvent] = []
+        # When False, add_message drops messages without building them (e.g. challenge dry runs)
+        self.messages_enabled: bool = True
         self.day_has_ended: bool = False
         # Display ID cache for challenge resolution (maintains consistent IDs even if cards clear)
         self._display_id_cache: dict[str, str] = {}
@@ -94,7 +125,7 @@ class GameEngine:
         if self._display_id_cache and card.id in self._display_id_cache:
             return self._display_id_cache[card.id]
         # Fallback to live computation
-        return get_display_id(self.state.all_cards_in_play(), card)
+        return self.state.get_display_id(card)
 
     def will_challenge_resolve(self, card: Card, icon: ChallengeIcon) -> bool:
         """
@@ -107,10 +138,10 @@ class GameEngine:
         IMPORTANT: Retrieves the handler from the COPIED card, not the original,
         to prevent the dry run from modifying the original game state.
         """
-        import copy
-
-        # Create a deep copy of the engine for the dry run
-        dry_run_engine = copy.deepcopy(self)
+        # Create a deep copy of the engine for the dry run. The message history is never
+        # read by the dry run, so seed the memo with an empty queue instead of copying it.
+        dry_run_engine = copy.deepcopy(self, {id(self.message_queue): []})
+        dry_run_engine.messages_enabled = False
 
         # Replace all user interaction callbacks with deterministic defaults
         # This prevents prompting the player during the dry run
@@ -120,9 +151,6 @@ class GameEngine:
         dry_run_engine.order_decider = dry_run_engine._default_order_decider
         dry_run_engine.option_chooser = dry_run_engine._default_option_chooser
 
-        # Clear messages to avoid pollution
-        dry_run_engine.message_queue = []
-
         # Get the COPIED version of the card to prevent modifying original state
         copied_card = dry_run_engine.state.get_card_by_id(card.id)
         if not copied_card:
@@ -181,19 +209,21 @@ class GameEngine:
         Finds the closest area containing a PREVENT_INTERACTION_PAST ability (from
         Obstacle keyword), then removes candidates in areas farther from the ranger."""
         # Gather active ConstantAbilities that block interaction
-        ability_ids = [ability.source_card_id for ability in self.constant_abilities 
-                     if ability.ability_type==ConstantAbilityType.PREVENT_INTERACTION_PAST
-                     and ability.is_active(self.state, Card())] #card input unused; pass in empty card dummy
-        ability_areas : list[Area]= []
-        for id in ability_ids:
-            area = self.state.get_card_area_by_id(id)
+        blocking = self.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_INTERACTION_PAST)
+        if not blocking:
+            return candidates  # No obstacles
+        dummy = Card() #card input unused; pass in empty card dummy
+        ability_areas: set[Area] = set()
+        for ability in blocking:
+            if not ability.is_active(self.state, dummy):
+                continue
+            area = self.state.get_card_area_by_id(ability.source_card_id)
             if area is None:
                 raise RuntimeError(f"ability_id points to no Card object!")
-            else:
-                ability_areas.append(area)
+            ability_areas.add(area)
         # Find closest ready Obstacle
         closest_obstacle_area = None
-        for area in [Area.WITHIN_REACH, Area.ALONG_THE_WAY, Area.SURROUNDINGS]:
+        for area in _OBSTACLE_SEARCH_ORDER:
             if area in ability_areas:
                 closest_obstacle_area = area
                 break
@@ -201,17 +231,10 @@ class GameEngine:
         if closest_obstacle_area is None:
             return candidates  # No obstacles
 
-        # Determine valid areas (at/before obstacle)
-        valid_areas = {Area.PLAYER_AREA}
-        if closest_obstacle_area == Area.WITHIN_REACH:
-            valid_areas.add(Area.WITHIN_REACH)
-        elif closest_obstacle_area == Area.ALONG_THE_WAY:
-            valid_areas.update([Area.WITHIN_REACH, Area.ALONG_THE_WAY])
-        elif closest_obstacle_area == Area.SURROUNDINGS:
-            valid_areas.update([Area.WITHIN_REACH, Area.ALONG_THE_WAY, Area.SURROUNDINGS])
-
-        return [card for card in candidates
-                if self.state.get_card_area_by_id(card.id) in valid_areas]
+        # Keep candidates at/before the obstacle
+        valid_areas = _AREAS_UP_TO_OBSTACLE[closest_obstacle_area]
+        area_by_id = self.state.get_in_play_index().area_by_id
+        return [card for card in candidates if area_by_id.get(card.id) in valid_areas]
 
     def interaction_fatigue(self, ranger: RangerState, target: Card) -> None:
         """Apply fatigue from each ready, non-Friendly card between the ranger and target.
@@ -223,18 +246,16 @@ class GameEngine:
         if target_area is None:
             raise RuntimeError(f"Something went horribly wrong, this target has no area.")
 
-        all_cards = self.state.all_cards_in_play()
         fatiguing_cards = [card for card in cards_between if not isinstance(card, FacedownCard) and card.is_ready() and not card.has_keyword(Keyword.FRIENDLY)]
-        target_display_id = get_display_id(all_cards, target)
-        self.add_message(f"Target: {target_display_id} in {target_area.value}. Checking interaction fatigue...")
+        self.add_message(lambda: f"Target: {self.state.get_display_id(target)} in {target_area.value}. Checking interaction fatigue...")
         if not fatiguing_cards:
             self.add_message(f"No cards between you and the target; no interaction fatigue.")
             return
         else:
             self.add_message(f"Each ready, non-Friendly card between you and the target fatigues you:")
             for card in fatiguing_cards:
-                card_display_id = get_display_id(all_cards, card)
-                self.add_message(f"    {card_display_id} fatigues you.")
+                if self.messages_enabled:
+                    self.add_message(f"    {self.state.get_display_id(card)} fatigues you.")
                 curr_presence = card.get_current_presence(self)
                 if curr_presence is not None:
                     self.state.ranger.fatigue(self, curr_presence)
@@ -248,13 +269,13 @@ class GameEngine:
         approach, and difficulty, then applies interaction fatigue from ready non-Friendly
         cards between the ranger and the target. Untargeted tests skip fatigue."""
         target_card = self.state.get_card_by_id(target_id)
-        # Get display strings for aspect/approach
-        aspect_str = action.aspect.value if isinstance(action.aspect, Aspect) else action.aspect
-        approach_str = action.approach.value if isinstance(action.approach, Approach) else action.approach  
-
         # Show player Test Step 1 information
-        self.add_message(f"[{action.verb}] test initiated of aspect [{aspect_str}] and approach [{approach_str}].")
-        self.add_message(f"This test is of difficulty {action.difficulty_fn(self,target_card)}.")
+        if self.messages_enabled:
+            # Action.__post_init__ guarantees enum aspect/approach on test actions
+            aspect = cast(Aspect, action.aspect)
+            approach = cast(Approach, action.approach)
+            self.add_message(f"[{action.verb}] test initiated of aspect [{aspect.value}] and approach [{approach.value}].")
+        self.add_message(lambda: f"This test is of difficulty {action.difficulty_fn(self,target_card)}.")
         self.add_message(f"Step 1: Ready cards between you and your interaction target may fatigue you.")
         if target_id is not None:
             target = self.state.get_card_by_id(target_id)
@@ -266,6 +287,12 @@ class GameEngine:
         self.add_message(f"Step 2: Commit effort from your energy pool, approach icons in hand, and other sources.")
         
 
+    def perform_nontest_action(self, action: Action, target_id: Optional[str]) -> ChallengeOutcome:
+        """Resolve a non-test action (e.g. Rest, play, exhaust): on_success with zero effort,
+        skipping the challenge draw and energy spend."""
+        action.on_success(self, 0, self.state.get_card_by_id(target_id))
+        return _NO_TEST_OUTCOME
+
     def perform_test(self, action: Action, decision: CommitDecision, target_id: Optional[str]) -> ChallengeOutcome:
         """Resolve a test action through the 5-step test sequence.
 
@@ -277,20 +304,17 @@ class GameEngine:
           5. Resolve challenge icon effects (Sun/Mountain/Crest) on all ready cards
              in area order, with player-chosen resolution order within each area
 
-        Non-test actions (e.g. Rest) skip directly to on_success with zero effort.
+        Non-test actions (e.g. Rest) are handed to perform_nontest_action.
         Returns a ChallengeOutcome summarizing the test result."""
-        # Non-test actions (e.g., Rest) skip challenge + energy
-        target_card: Card | None = self.state.get_card_by_id(target_id)
-
         if not action.is_test:
-            action.on_success(self, 0, target_card)
-            return ChallengeOutcome(modifier=0, symbol=ChallengeIcon.SUN, resulting_effort=0, success=True)
+            return self.perform_nontest_action(action, target_id)
 
+        target_card: Card | None = self.state.get_card_by_id(target_id)
         r = self.state.ranger        
 
-        # At this point, action.aspect/approach are guaranteed to be enums (not str) since is_test=True
-        aspect = action.aspect if isinstance(action.aspect, Aspect) else Aspect.AWA  # type guard
-        approach = action.approach if isinstance(action.approach, Approach) else Approach.EXPLORATION  # type guard
+        # Action.__post_init__ guarantees enum aspect/approach on test actions
+        aspect = cast(Aspect, action.aspect)
+        approach = cast(Approach, action.approach)
         if r.energy.get(aspect, 0) < decision.energy:
             raise RuntimeError(f"Insufficient energy for {aspect}")
         r.energy[aspect] -= decision.energy
@@ -323,9 +347,9 @@ class GameEngine:
                 difficulty = max(0, difficulty + ability.modifier.amount)
 
         # Step 4: Determine success or failure and apply results.
-        self.add_message(f"Step 4: Determine success or failure and apply results.")
-        self.add_message(f"Total effort committed: {base_effort}")
-        self.add_message(f"Test difficulty: {difficulty}")
+        self.add_messages(lambda: (f"Step 4: Determine success or failure and apply results.",
+                                   f"Total effort committed: {base_effort}",
+                                   f"Test difficulty: {difficulty}"))
         success = effort >= difficulty
 
         # Track test outcome and target (for edge case challenge effects)
@@ -334,8 +358,8 @@ class GameEngine:
         progress_before = target_card.progress if target_card else 0
 
         if success:
-            self.add_message(f"Result: {base_effort} + ({mod:d}) = {effort} >= {difficulty}")
-            self.add_message(f"Test succeeded!")
+            self.add_messages(lambda: (f"Result: {base_effort} + ({mod:d}) = {effort} >= {difficulty}",
+                                       "Test succeeded!"))
             action.on_success(self, effort, target_card)
             self.trigger_listeners(EventType.TEST_SUCCEED, TimingType.AFTER, action, effort)
 
@@ -344,57 +368,46 @@ class GameEngine:
                 self.last_test_added_progress = (target_card.progress > progress_before)
 
         else:
-            self.add_message(f"Result: {base_effort} + ({mod:d}) = {effort} < {difficulty}")
-            self.add_message(f"Test failed!")
+            self.add_messages(lambda: (f"Result: {base_effort} + ({mod:d}) = {effort} < {difficulty}",
+                                       "Test failed!"))
             if action.on_fail:
                 action.on_fail(self, effort, target_card)
             self.trigger_listeners(EventType.TEST_FAIL, TimingType.AFTER, action, effort)
 
-        cleared : list[Card]= []
-        cleared.extend(self.check_and_process_clears())
-
-        for cleared_card in cleared:
+        for cleared_card in self.check_and_process_clears():
             self.add_message(f"{cleared_card.title} cleared!")
 
-        cleared.clear()
+        cleared: list[Card] = []
         # Step 5:  Resolve Challenge effects (dynamically from active cards)
         # TODO: Future challenge resolution features:
         #   - If new cards enter play during challenge resolution, their effects should trigger
         #   - If cards move areas during challenge resolution and become active, their effects should trigger
         self.add_message(f"Step 5: Resolve [{icon.upper()}] challenge effects, if any.")
-        challenge_areas : list[Area] = [
-            Area.SURROUNDINGS,     # Weather, Location, Mission
-            Area.ALONG_THE_WAY,
-            Area.WITHIN_REACH,
-            Area.PLAYER_AREA,
-        ]
-
         zero_challenge_effects_resolved = True
-        already_resolved_ids: list[tuple[str, ChallengeIcon]] = []
+        already_resolved_ids: set[str] = set() #one icon per test, so card ids suffice
         #track which cards had a challenge effect resolve so they don't resolve again
 
+        # Nothing in play handles this icon: skip the display-id snapshot and area scan
+        any_handlers = self.state.has_challenge_handler(icon)
+
         # Pre-compute display IDs for all cards before any effects resolve
         # This ensures consistent naming even if cards get cleared mid-resolution
-        all_cards_snapshot = self.state.all_cards_in_play()
+        # (skipped when messages are off; get_display_id_cached falls back to live ids)
         self._display_id_cache.clear()
-        for card in all_cards_snapshot:
-            self._display_id_cache[card.id] = get_display_id(all_cards_snapshot, card)
+        if any_handlers and self.messages_enabled:
+            self._display_id_cache.update(self.state.get_display_ids())
 
-        for area in challenge_areas:
+        for area in (_CHALLENGE_AREA_ORDER if any_handlers else ()):
             # Collect cards with challenge effects for this symbol in this area
-            cards_with_effects: list[Card] = []
-            for card in self.state.areas[area]:
-                if card.is_ready():
-                    handlers = card.get_challenge_handlers()
-                    if handlers and icon in handlers and (card.id, icon) not in already_resolved_ids:
-                        cards_with_effects.append(card)
+            cards_with_effects: list[Card] = [card for card in self.state.get_cards_with_challenge_handler(icon, area)
+                                              if card.is_ready() and card.id not in already_resolved_ids]
+            if not cards_with_effects:
+                continue
 
             # Filter to only effects that would actually resolve
             # This prevents prompting the player to order effects that won't change the gamestate
-            resolvable_cards: list[Card] = []
-            for card in cards_with_effects:
-                if self.will_challenge_resolve(card, icon):
-                    resolvable_cards.append(card)
+            resolvable_cards: list[Card] = [card for card in cards_with_effects
+                                            if self.will_challenge_resolve(card, icon)]
 
             # If multiple cards have resolvable effects in the same area, let player choose order
             if len(resolvable_cards) > 1:
@@ -404,12 +417,14 @@ class GameEngine:
             # Resolve effects in the chosen order
             for card in resolvable_cards:
                 handlers = card.get_challenge_handlers()
-                if handlers and icon in handlers and (card.id, icon) not in already_resolved_ids:
-                    resolved = handlers[icon](self)
+                handler = handlers.get(icon) if handlers else None
+                if handler is not None and card.id not in already_resolved_ids:
+                    resolved = handler(self)
                     if resolved:
-                        already_resolved_ids.append((card.id, icon))
+                        already_resolved_ids.add(card.id)
                         zero_challenge_effects_resolved = False
-                    cleared.extend(self.check_and_process_clears())
+                        #a handler that didn't resolve left progress/harm untouched
+                        cleared.extend(self.check_and_process_clears())
 
         if zero_challenge_effects_resolved:
             self.add_message("No challenge effects resolved.")
@@ -446,41 +461,37 @@ class GameEngine:
         cleared: list[Card] = []       # all cards that hit a clear threshold
         to_discard: list[Card] = []     # subset that still need the default discard
 
-        for area in self.state.areas:
-            for card in self.state.areas[area]:
-                if card.has_type(CardType.PATH):
-                    clear_type = card.clear_if_threshold(self.state)
-                    discarded = False
-                    if clear_type == "progress":
-                        self.add_message(f"{card.title} cleared by progress!")
-                        if card.on_progress_clear_log is not None:
-                            discarded = self.campaign_guide.resolve_entry(
-                                entry_number=card.on_progress_clear_log,
-                                source_card=card,
-                                engine=self,
-                                clear_type=clear_type
-                            )
-                        if not discarded:
-                            card.on_progress_clear(self)
-                        cleared.append(card)
-                        # Re-check threshold: the entry may have removed progress/harm
-                        if not discarded and card.clear_if_threshold(self.state) is not None:
-                            to_discard.append(card)
-                    elif clear_type == "harm":
-                        self.add_message(f"{card.title} cleared by harm!")
-                        if card.on_harm_clear_log is not None:
-                            discarded = self.campaign_guide.resolve_entry(
-                                entry_number=card.on_harm_clear_log,
-                                source_card=card,
-                                engine=self,
-                                clear_type=clear_type
-                            )
-                        if not discarded:
-                            card.on_harm_clear(self)
-                        cleared.append(card)
-                        # Re-check threshold: the entry may have removed progress/harm
-                        if not discarded and card.clear_if_threshold(self.state) is not None:
-                            to_discard.append(card)
+        # Only path cards clear. The index's bucket is read without copying: an area
+        # change builds a fresh index rather than editing this one, so the list itself
+        # is stable. It is still a snapshot, though, so cards that an earlier clear
+        # removed from play are skipped below.
+        state = self.state
+        for card in state.get_in_play_index().by_type.get(CardType.PATH, ()):
+            if state.get_card_area_by_id(card.id) is None:
+                continue
+            clear_type = card.clear_if_threshold(state)
+            if clear_type is None:
+                continue
+            self.add_message(f"{card.title} cleared by {clear_type}!")
+            by_progress = clear_type == "progress"
+            clear_log = card.on_progress_clear_log if by_progress else card.on_harm_clear_log
+            discarded = False
+            if clear_log is not None:
+                discarded = self.campaign_guide.resolve_entry(
+                    entry_number=clear_log,
+                    source_card=card,
+                    engine=self,
+                    clear_type=clear_type
+                )
+            if not discarded:
+                if by_progress:
+                    card.on_progress_clear(self)
+                else:
+                    card.on_harm_clear(self)
+            cleared.append(card)
+            # Re-check threshold: the entry may have removed progress/harm
+            if not discarded and card.clear_if_threshold(state) is not None:
+                to_discard.append(card)
 
         # Trigger clear listeners for ALL cards that hit a clear threshold,
         # regardless of whether they were discarded by their campaign entry
@@ -504,15 +515,14 @@ class GameEngine:
         if curr_card is None:
             raise RuntimeError(f"The current location id of the ranger token points to no card!")
         else:
-            blockers = [blocker for blocker in self.constant_abilities 
-                        if blocker.ability_type == ConstantAbilityType.PREVENT_RANGER_TOKEN_MOVE
-                        and blocker.condition_fn(self.state, card)]
+            blockers = [blocker for blocker in self.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_RANGER_TOKEN_MOVE)
+                        if blocker.condition_fn(self.state, card)]
             if blockers:
                 blocker_card = self.state.get_card_by_id(blockers[0].source_card_id)
                 if blocker_card is None:
                     raise RuntimeError(f"Card blocking ranger token movement does not exist!")
                 
-                blocker_display = get_display_id(self.state.all_cards_in_play(), blocker_card)
+                blocker_display = self.state.get_display_id(blocker_card)
                 self.add_message(f"Your Ranger token cannot move due to {blocker_display}")
                 return False
             else:
@@ -547,22 +557,24 @@ class GameEngine:
 
         Returns the cumulative effort modifier from all triggered listeners (used
         by PERFORM_TEST listeners that add bonus effort; ignored by other callers)."""
-        triggered : list[EventListener]= []
-        for listener in self.listeners:
-                if listener.event_type == event_type and listener.timing_type == timing_type:
-                    if action is not None:
-                        # If listener.test_type is None, it matches all test types (wildcard)
-                        if listener.test_type is None:
-                            triggered.append(listener)
-                        elif action.verb is not None:
-                            # listener.test_type is guaranteed to be non-None here
-                            if action.verb.casefold() == listener.test_type.casefold():
-                                triggered.append(listener)
-                        else:
-                            raise RuntimeError(f"A listener that triggers during an action should have a verb and test_type to compare.")
-                    else:
-                        #trigger happens outside of tests, no need to compare
+        bucket = self._listeners_by_event.get((event_type, timing_type))
+        if not bucket:
+            return 0
+        if action is None:
+            #trigger happens outside of tests, no need to compare
+            triggered: list[EventListener] = list(bucket)
+        else:
+            triggered = []
+            verb = action.verb_key
+            for listener in bucket:
+                # If listener.test_type is None, it matches all test types (wildcard)
+                if listener.test_type_key is None:
+                    triggered.append(listener)
+                elif verb is not None:
+                    if verb == listener.test_type_key:
                         triggered.append(listener)
+                else:
+                    raise RuntimeError(f"A listener that triggers during an action should have a verb and test_type to compare.")
 
         # If multiple listeners trigger simultaneously, let player choose order
         if len(triggered) > 1:
@@ -580,16 +592,18 @@ class GameEngine:
     def register_listeners(self, listeners: list[EventListener]) -> None:
         """Add an event listener to the active listener registry"""
         self.listeners.extend(listeners)
+        for listener in listeners:
+            self._listeners_by_event.setdefault((listener.event_type, listener.timing_type), []).append(listener)
+            self._listeners_by_source.setdefault(listener.source_card_id, []).append(listener)
 
     def remove_listeners_by_id(self, id: str) -> None:
         """Remove listeners by source card ID"""
-        targets: list[EventListener] = []
-        for listener in self.listeners:
-            if listener.source_card_id == id:
-                targets.append(listener)
-        if targets:
-            for target in targets:
-                self.listeners.remove(target)
+        targets = self._listeners_by_source.pop(id, None)
+        if not targets:
+            return
+        self.listeners[:] = [listener for listener in self.listeners if listener.source_card_id != id]
+        for target in targets:
+            self._listeners_by_event[(target.event_type, target.timing_type)].remove(target)
 
     def reconstruct(self) -> None:
         """
@@ -603,52 +617,76 @@ class GameEngine:
         Per game rules, only Moment cards establish listeners while in hand.
         """
         self.listeners.clear()
+        self._listeners_by_event.clear()
+        self._listeners_by_source.clear()
         self.constant_abilities.clear()
+        self._constant_abilities_by_type.clear()
 
         # Listeners from Moment cards in hand (only Moments have hand listeners)
         for card in self.state.ranger.hand:
             if card.has_type(CardType.MOMENT):
                 listeners = card.get_listeners()
                 if listeners:
-                    self.listeners.extend(listeners)
+                    self.register_listeners(listeners)
 
         # Listeners and abilities from cards in play
         for card in self.state.all_cards_in_play():
             listeners = card.get_listeners()
             if listeners:
-                self.listeners.extend(listeners)
+                self.register_listeners(listeners)
 
             abilities = card.get_constant_abilities()
             if abilities:
-                self.constant_abilities.extend(abilities)
+                self.register_constant_abilities(abilities)
 
 
     # ConstantAbility management methods
     def register_constant_abilities(self, abilities: list[ConstantAbility]):
         """Register a constant ability from a card entering play"""
         self.constant_abilities.extend(abilities)
+        for ability in abilities:
+            self._constant_abilities_by_type.setdefault(ability.ability_type, []).append(ability)
 
     def remove_constant_abilities_by_id(self, card_id: str):
         """Remove all constant abilities from a specific card (for cleanup)"""
+        removed_types = {a.ability_type for a in self.constant_abilities if a.source_card_id == card_id}
+        if not removed_types:
+            return
         self.constant_abilities = [
             a for a in self.constant_abilities
             if a.source_card_id != card_id
         ]
+        for ability_type in removed_types:
+            self._constant_abilities_by_type[ability_type] = [
+                a for a in self._constant_abilities_by_type[ability_type]
+                if a.source_card_id != card_id
+            ]
 
     def get_constant_abilities_by_type(self, ability_type: ConstantAbilityType) -> list[ConstantAbility]:
         """Get all constsant abilities of a specific type"""
-        return [
-            ability for ability in self.constant_abilities
-            if ability.ability_type == ability_type
-        ]
+        return list(self._constant_abilities_by_type.get(ability_type, ()))
         
     # Message management methods
 
-    def add_message(self, message: str) -> None:
-        """Add a message to the message queue"""
+    def add_message(self, message: str | Callable[[], str]) -> None:
+        """Add a message to the message queue. Accepts a zero-argument callable for messages
+        that are costly to format; it is only called while messages are enabled."""
+        if not self.messages_enabled:
+            return
+        if callable(message):
+            message = message()
         new_message = MessageEvent(message)
         self.message_queue.append(new_message)
 
+    def add_messages(self, messages: Iterable[str] | Callable[[], Iterable[str]]) -> None:
+        """Add several messages to the queue in one go. Like add_message, accepts a zero-argument
+        callable that is only called while messages are enabled."""
+        if not self.messages_enabled:
+            return
+        if callable(messages):
+            messages = messages()
+        self.message_queue.extend(map(MessageEvent, messages))
+
     def get_messages(self) -> list[MessageEvent]:
         """Get copy of current message queue"""
         return self.message_queue.copy()
@@ -657,6 +695,13 @@ class GameEngine:
         """Clear the message queue"""
         self.message_queue.clear()
 
+    def drain_messages(self) -> list[MessageEvent]:
+        """Take every queued message and leave the queue empty, without copying.
+        Prefer this over get_messages() followed by clear_messages()."""
+        drained = self.message_queue
+        self.message_queue = []
+        return drained
+
     #Gamestate manipulation methods
 
     def move_card(self, card_id : str | None, target_area : Area) -> bool:
@@ -665,10 +710,17 @@ class GameEngine:
         When a card moves, all of its attachments (and recursive attachments) move with it.
         Cards that are attached to other cards cannot move independently.
         """
-        target_card : Card | None = self.state.get_card_by_id(card_id)
-        current_area : Area | None = self.state.get_card_area_by_id(card_id)
+        current_area : Area | None = None
+        target_card : Card | None = None
+        if card_id is not None:
+            index = self.state.get_in_play_index()
+            current_area = index.area_by_id.get(card_id)
+            target_card = index.by_id.get(card_id)
+        if target_card is None:
+            target_card = self.state.get_card_by_id(card_id) #not in play; scan the other piles
         if target_card is not None:
-            target_display_id = get_display_id(self.state.all_cards_in_play(), target_card)
+            #display ids are only needed for messages, which are off during challenge dry runs
+            target_display_id = self.state.get_display_id(target_card) if self.messages_enabled else target_card.title
             if target_area==current_area:
                 self.add_message(f"{target_display_id} already in {target_area.value}.")
                 return False
@@ -678,7 +730,7 @@ class GameEngine:
                 return False
             if current_area is not None:
                 # Move the card itself
-                self.state.areas[current_area].remove(target_card)
+                remove_by_identity(self.state.areas[current_area], target_card)
                 self.state.areas[target_area].append(target_card)
                 self.add_message(f"{target_display_id} moves to {target_area.value}.")
 
@@ -692,6 +744,10 @@ class GameEngine:
                 return True
         return False
     
+    def move_cards(self, card_ids: list[str], target_area: Area) -> list[str]:
+        """Move several cards to a target area, in the given order. Returns the ids of the cards that actually moved."""
+        return [card_id for card_id in card_ids if self.move_card(card_id, target_area)]
+
     def move_token(self, source_card_id: str, target_card_id: str, source_token_type: str, amount: int) -> int:
         """Move AMOUNT tokens of type SOURCE_TOKEN_TPE from SOURCE_CARD to TARGET_CARD. 
         
@@ -729,10 +785,9 @@ class GameEngine:
             current_area = self.state.get_card_area_by_id(attached_id)
             if current_area is not None and current_area != target_area:
                 # Move the attachment
-                self.state.areas[current_area].remove(attached_card)
+                remove_by_identity(self.state.areas[current_area], attached_card)
                 self.state.areas[target_area].append(attached_card)
-                attached_display_id = get_display_id(self.state.all_cards_in_play(), attached_card)
-                self.add_message(f"  {attached_display_id} (attached) moves to {target_area.value}.")
+                self.add_message(lambda: f"  {self.state.get_display_id(attached_card)} (attached) moves to {target_area.value}.")
 
                 # Recursively move this attachment's attachments
                 self._move_attachments_recursively(attached_card, target_area)
@@ -809,7 +864,7 @@ class GameEngine:
             return
 
         for card in set_aside:
-            self.state.ranger.hand.remove(card)
+            remove_by_identity(self.state.ranger.hand, card)
             self.add_message(f"Set aside {card.title}.")
 
         num_to_draw = len(set_aside)
@@ -831,8 +886,6 @@ class GameEngine:
         Saves current location and terrain to campaign tracker, then raises
         DayEndException to halt execution and trigger day-end procedure.
         """
-        from .models import DayEndException
-
         # Save current location and terrain for next day
         # Use title instead of id since location registry keys are titles
         self.state.campaign_tracker.current_location_id = self.state.location.title
@@ -866,7 +919,6 @@ class GameEngine:
         Returns:
             A fresh GameState ready for a new day
         """
-        from .models import RangerState, GameState, Area
         from .collection import build_collection_for_day
 
         # TODO: Load ranger deck from card IDs in campaign tracker
@@ -975,16 +1027,14 @@ class GameEngine:
                 "Order cards for BOTTOM of deck (first choice will be farthest from bottom; last choice will be bottom)"))
 
         # Step 5: Reconstruct the deck
-        # Remove all scouted cards from the deck
-        for card in scouted_cards:
-            deck.remove(card)
+        # Remove all scouted cards from the deck (they are exactly its top cards)
+        del deck[:actual_count]
 
         # Add bottom pile to end of remaining deck (in order, first card goes closest to bottom)
         deck.extend(bottom_pile)
 
-        # Add top pile to beginning of deck (in reverse, so first card ends up on top)
-        for card in reversed(top_pile):
-            deck.insert(0, card)
+        # Add top pile to beginning of deck (first card ends up on top)
+        deck[:0] = top_pile
 
         self.add_message(f"Scout complete: {len(top_pile)} cards on top, {len(bottom_pile)} cards on bottom.")
 
@@ -1013,8 +1063,8 @@ class GameEngine:
                 self.state.areas[attachment_target_area].append(to_attach)
         attachment_target.attached_card_ids.append(to_attach.id)
         to_attach.attached_to_id = attachment_target.id
-        to_attach_display = get_display_id(self.state.all_cards_in_play(), to_attach)
-        attachment_target_display = get_display_id(self.state.all_cards_in_play(), attachment_target)
+        to_attach_display = self.state.get_display_id(to_attach)
+        attachment_target_display = self.state.get_display_id(attachment_target)
         self.add_message(f"{to_attach_display} becomes attached to {attachment_target_display}.")
         #TODO: a card "attached facedown" loses all tokens from itself
         
@@ -1031,8 +1081,8 @@ class GameEngine:
         else:
             attached_to.attached_card_ids.remove(to_unattach.id)
             to_unattach.attached_to_id = None
-            to_unattach_display = get_display_id(self.state.all_cards_in_play(), to_unattach)
-            attached_to_display = get_display_id(self.state.all_cards_in_play(), attached_to)
+            to_unattach_display = self.state.get_display_id(to_unattach)
+            attached_to_display = self.state.get_display_id(attached_to)
             self.add_message(f"{to_unattach_display} unattaches from {attached_to_display}.")
             if CardType.ATTACHMENT in to_unattach.card_types:
                 to_unattach.discard_from_play(self) #attachments cannot exist in play without being attached
@@ -1076,9 +1126,8 @@ class GameEngine:
         Returns True if the day ended by camping during travel, False otherwise."""
         self.add_message(f"Begin Phase 3: Travel")
         location_progress_threshold = self.state.location.get_progress_threshold()
-        travel_blockers = [ability for ability in self.constant_abilities 
-                           if ability.ability_type == ConstantAbilityType.PREVENT_TRAVEL
-                           and ability.condition_fn(self.state, Card())] #travel blockers don't use Card input
+        travel_blockers = [ability for ability in self.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_TRAVEL)
+                           if ability.condition_fn(self.state, Card())] #travel blockers don't use Card input
         if travel_blockers:
             travel_blocker_ids: list[str] = []
             for blocker_ability in travel_blockers:
@@ -1086,7 +1135,7 @@ class GameEngine:
                 if card is None:
                     raise RuntimeError(f"Travel-blocking id points to no card!")
                 else:
-                    travel_blocker_ids.append(get_display_id(self.state.all_cards_in_play(),card))
+                    travel_blocker_ids.append(self.state.get_display_id(card))
             self.add_message(f"You cannot travel due to: {travel_blocker_ids}")
             return False
         
@@ -1158,7 +1207,6 @@ class GameEngine:
         #Step 2: Travel to a new location
 
         curr_location = self.state.location
-        from .decks import get_available_travel_destinations
         available_destinations = get_available_travel_destinations(curr_location)
         destination_titles = [loc.title for loc in available_destinations]
 
@@ -1167,7 +1215,7 @@ class GameEngine:
         new_location = next(loc for loc in available_destinations if loc.title == chosen_title)
 
         self.state.areas[Area.SURROUNDINGS].append(new_location)
-        self.state.areas[Area.SURROUNDINGS].remove(curr_location)
+        remove_by_identity(self.state.areas[Area.SURROUNDINGS], curr_location)
         self.state.location = new_location
         self.add_message(f"Traveled away from {curr_location.title} to {new_location.title}.")
         self.state.location.enters_play(self, Area.SURROUNDINGS, None)
@@ -1195,7 +1243,6 @@ class GameEngine:
         do_arrival_setup for location-specific effects."""
         if start_of_day:
             self.add_message(f"Step 5: Set up starting location")
-            from .decks import get_location_by_id
             self.state.location = get_location_by_id(self.state.campaign_tracker.current_location_id)
             self.state.areas[Area.SURROUNDINGS].append(self.state.location)
             self.state.location.enters_play(self, Area.SURROUNDINGS, None)
@@ -1263,7 +1310,7 @@ class GameEngine:
         self.add_message("Resolving refresh effects...")
         self.trigger_listeners(EventType.REFRESH, TimingType.WHEN, None, 0)
         #Step 5: Ready all cards in play
-        for area in self.state.areas:
-            for card in self.state.areas[area]:
+        for card in self.state.all_cards_in_play():
+            if card.is_exhausted():
                 card.ready(self) #ignore messages to prevent clutter
         self.add_message("All cards in play Ready.")
@@ -3,9 +3,18 @@ Utility functions for loading card data from JSON files
 """
 
 import json
+import re
+import sys
+from functools import cache
 from pathlib import Path
 from .models import Aspect, Approach, Area, CardType, Keyword
 
+try:
+    # orjson is an optional speedup for parsing card files; fall back to the stdlib parser
+    from orjson import loads as _json_loads #type:ignore
+except ImportError:
+    _json_loads = json.loads
+
 #Gonna be a lot of type-ignore in this file because JSON's wonky
 
 # Map card set to their JSON files
@@ -24,6 +33,7 @@ CARD_JSON_FILES = {
 }
 
 
+@cache
 def get_project_root() -> Path:
     """Get the project root directory"""
     current = Path(__file__).resolve().parent
@@ -47,12 +57,27 @@ def load_card_fields(title: str, card_set: str) -> dict: # type: ignore
     Returns:
         Dictionary with common Card fields ready to unpack
     """
+    fields = dict(_parse_card_fields(title, card_set)) #type:ignore
+    # Parsing is cached per (title, set); give each card its own copy of the mutable containers
+    fields["traits"] = set(fields["traits"]) #type:ignore
+    fields["keywords"] = set(fields["keywords"]) #type:ignore
+    fields["abilities_text"] = list(fields["abilities_text"]) #type:ignore
+    fields["approach_icons"] = dict(fields["approach_icons"]) #type:ignore
+    if fields["mission_locations"] is not None:
+        fields["mission_locations"] = list(fields["mission_locations"]) #type:ignore
+    return fields #type:ignore
+
+
+@cache
+def _parse_card_fields(title: str, card_set: str) -> dict: # type: ignore
+    """Parse a card's JSON entry into Card fields once per (title, set). Callers must not
+    mutate the result; load_card_fields hands out copies."""
     data = load_card_json_by_title(title, card_set)  # type: ignore
 
     #title, id, and card_set all taken care of by parameters or post_init
 
     flavor_text = str(data.get("flavor_text", "")) #type:ignore
-    card_types : set[CardType]= parse_card_types(card_set, str(data.get("card_type", ""))) #type:ignore
+    card_types : frozenset[CardType] = frozenset(parse_card_types(card_set, str(data.get("card_type", "")))) #type:ignore
     traits = set(parse_traits(data))
     abilities = parse_card_abilities(data)
     starting_tokens = parse_starting_tokens(data)
@@ -78,7 +103,7 @@ def load_card_fields(title: str, card_set: str) -> dict: # type: ignore
 
 
     return { #type: ignore
-        "title": title,
+        "title": sys.intern(title), #index lookups by title then hit the identity fast path
         "card_set": card_set,
         "flavor_text": flavor_text,
         "card_types": card_types,
@@ -120,12 +145,31 @@ def load_card_json_by_title(title: str, card_set: str) -> dict: #type: ignore
         set: The card's origin set (e.g., "Explorer", "Valley")
 
     Returns:
-        Dictionary containing the card's JSON data. Type ignore because JSON dicts are complex
+        Dictionary containing the card's JSON data. Type ignore because JSON dicts are complex.
+        The dict is shared between calls, so treat it as read-only.
 
     Raises:
         ValueError: If card not found or file doesn't exist
     """
-    json_file = CARD_JSON_FILES.get(card_set.lower())
+    cards_by_title = load_card_set(card_set.lower()) #type:ignore
+    card = cards_by_title.get(title) #type:ignore
+    if card is None:
+        raise ValueError(f"Card '{title}' not found in {CARD_JSON_FILES[card_set.lower()]}")
+    return card #type:ignore
+
+
+@cache
+def load_card_set(card_set: str) -> dict[str, dict]: #type: ignore
+    """
+    Read a set's JSON file once and index its cards by title.
+
+    Args:
+        card_set: Lowercase set name, a key of CARD_JSON_FILES
+
+    Raises:
+        ValueError: If the set is unknown or its file doesn't exist
+    """
+    json_file = CARD_JSON_FILES.get(card_set)
     if not json_file:
         raise ValueError(f"Unknown card set: {card_set}")
 
@@ -133,8 +177,7 @@ def load_card_json_by_title(title: str, card_set: str) -> dict: #type: ignore
     if not json_path.exists():
         raise ValueError(f"JSON file not found: {json_path}")
 
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _json_loads(json_path.read_bytes()) #type:ignore
 
     # JSON is either a list or a dict with "cards" key
     if isinstance(data, list):
@@ -142,12 +185,11 @@ def load_card_json_by_title(title: str, card_set: str) -> dict: #type: ignore
     else:
         cards = data.get("cards", [])
 
-    # Search for the card by title
+    # First card with a given title wins, matching a front-to-back search
+    cards_by_title: dict[str, dict] = {} #type:ignore
     for card in cards: #type:ignore
-        if card.get("title") == title: #type:ignore
-            return card #type:ignore
-
-    raise ValueError(f"Card '{title}' not found in {json_file}")
+        cards_by_title.setdefault(card.get("title"), card) #type:ignore
+    return cards_by_title #type:ignore
 
 def parse_starting_tokens(card_data : dict) -> tuple[str,int] | None: #type:ignore
     enters_play_with = card_data.get("enters_play_with", {}) #type:ignore
@@ -281,9 +323,13 @@ def parse_aspect_requirement(card_data: dict) -> tuple[Aspect | None, int]: #typ
 
 
 def parse_traits(card_data: dict) -> list[str]:  #type: ignore
-    """Parse traits list from JSON"""
-    return card_data.get("traits", []) #type: ignore
+    """Parse traits list from JSON. Trait strings are interned so every card sharing a
+    trait holds the same string object, letting set/dict lookups match by identity."""
+    return [sys.intern(trait) for trait in card_data.get("traits", [])] #type: ignore
+
+
 
+_NON_DIGITS = re.compile(r"\D")
 
 
 def parse_threshold_value(value) -> tuple[int | None, bool, bool]: #type:ignore
@@ -305,14 +351,14 @@ def parse_threshold_value(value) -> tuple[int | None, bool, bool]: #type:ignore
         return (None, True, False)  # Nulled threshold
     if isinstance(value, int):
         return (value, False, False)
-    if isinstance(value, str) and value.casefold() == "Ranger Token".casefold():
+    if isinstance(value, str) and value.casefold() == "ranger token":
         return (None, False, True)
     # Parse string like "2R" - extract just the number
-    s = ''.join(ch for ch in str(value) if ch.isdigit()) #type:ignore
+    s = _NON_DIGITS.sub("", str(value)) #type:ignore
     return (int(s) if s else None, False, False)
 
 
-def parse_area(enters_play: str | None, card_types: set[CardType]) -> Area | None:
+def parse_area(enters_play: str | None, card_types: set[CardType] | frozenset[CardType]) -> Area | None:
     """Parse enters_play field to Area enum"""
     if enters_play is None:
         return None
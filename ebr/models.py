@@ -1,10 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, Callable, cast, TYPE_CHECKING
+from functools import cache, cached_property
+from itertools import chain
+from typing import Optional, Callable, ClassVar, cast, TYPE_CHECKING
 from enum import Enum
-from .utils import get_display_id
+from .utils import get_display_id, remove_by_identity
 import uuid
 import random
+import operator
 from .collection import CollectionChange, CardCollection
 if TYPE_CHECKING:
     from .engine import GameEngine
@@ -198,6 +201,12 @@ def _generate_campaign_id() -> str:
     return uuid.uuid4().hex[:8]
 
 
+@cache
+def _id_prefix(title: str) -> str:
+    """Readable card id prefix for a title, computed once per title (decks hold many copies)"""
+    return title.lower().replace(" ", "-").replace("'", "")
+
+
 @dataclass
 class CampaignTracker:
     """State that persists between days"""
@@ -239,17 +248,15 @@ class ChallengeCard:
     mods: dict[Aspect, int]
     reshuffle: bool
 
+    def __deepcopy__(self, memo: dict[int, object]) -> ChallengeCard:
+        #challenge cards are never modified once built, so copies of the deck (e.g. for
+        #challenge dry runs) can share them
+        return self
+
     def __repr__(self):
-        def mod_to_string(mod: int) -> str:
-            if mod >= 0:
-                return f"+{mod}"
-            else:
-                return f"{mod}"
-        awa_mod = mod_to_string(self.mods[Aspect.AWA])
-        fit_mod = mod_to_string(self.mods[Aspect.FIT])
-        foc_mod = mod_to_string(self.mods[Aspect.FOC])
-        spi_mod = mod_to_string(self.mods[Aspect.SPI])
-        return(f"AWA{awa_mod} | FIT{fit_mod} | FOC{foc_mod} | SPI{spi_mod} | {self.icon.value.upper()}" + (" | Reshuffle" if self.reshuffle else ""))
+        mods = self.mods #"+d" signs zero as well, e.g. AWA+0
+        return (f"AWA{mods[Aspect.AWA]:+d} | FIT{mods[Aspect.FIT]:+d} | FOC{mods[Aspect.FOC]:+d} | SPI{mods[Aspect.SPI]:+d}"
+                f" | {self.icon.name}" + (" | Reshuffle" if self.reshuffle else ""))
 
 
 class ChallengeDeck:
@@ -273,47 +280,52 @@ class ChallengeDeck:
 
     def draw_challenge_card(self, engine: GameEngine) -> ChallengeCard:
         """Draw a card from the deck, reshuffling if necessary."""
-        engine.add_message(f"Drawing challenge card...")
+        engine.add_message("Drawing challenge card...")
         if len(self.deck) == 0:
-            engine.add_message(f"Challenge deck empty; reshuffling.")
+            engine.add_message("Challenge deck empty; reshuffling.")
             self.reshuffle()
         drawn = self.deck.pop(0)
         self.discard.append(drawn)
-        engine.add_message(f"Drew {drawn}.")
+        engine.add_message(lambda: f"Drew {drawn}.") #repr formats all four modifiers
         if drawn.reshuffle:
             self.reshuffle()
-            engine.add_message(f"Challenge deck reshuffled.")
+            engine.add_message("Challenge deck reshuffled.")
         return drawn
 
 
+#(icon, AWA, FIT, SPI, FOC, reshuffle) for each card of the standard challenge deck
+_CHALLENGE_DECK_SPEC: tuple[tuple[ChallengeIcon, int, int, int, int, bool], ...] = (
+    (ChallengeIcon.SUN,       0,  -2, 1,  1,  True),
+    (ChallengeIcon.CREST,     0,  -1, 1,  0,  False),
+    (ChallengeIcon.MOUNTAIN,  -1, 0,  0,  -1, False),
+    (ChallengeIcon.CREST,     -1, 0,  -1, 0,  False),
+    (ChallengeIcon.CREST,     1,  1,  -2, 0,  True),
+    (ChallengeIcon.MOUNTAIN,  1,  -1, -1, 1,  False),
+    (ChallengeIcon.CREST,     -1, 0,  0,  1,  False),
+    (ChallengeIcon.SUN,       0,  -1, 0,  -1, False),
+    (ChallengeIcon.SUN,       0,  0,  -1, -1, False),
+    (ChallengeIcon.MOUNTAIN,  -1, 1,  1,  -1, False),
+    (ChallengeIcon.SUN,       1,  0,  0,  -1, False),
+    (ChallengeIcon.CREST,     1,  0,  1,  -2, True),
+    (ChallengeIcon.MOUNTAIN,  1,  -1, 0,  0,  False),
+    (ChallengeIcon.SUN,       -2, 1,  0,  1,  True),
+    (ChallengeIcon.SUN,       0,  1,  -1, 0,  False),
+    (ChallengeIcon.MOUNTAIN,  1,  0,  -1, 0,  False),
+    (ChallengeIcon.MOUNTAIN,  0,  -1, -1, 0,  False),
+    (ChallengeIcon.SUN,       -1, 1,  0,  0,  False),
+    (ChallengeIcon.CREST,     0,  0,  -1, 1,  False),
+    (ChallengeIcon.CREST,     -1, -1, 0,  0,  False),
+    (ChallengeIcon.SUN,       -1, 0,  1,  0,  False),
+    (ChallengeIcon.MOUNTAIN,  0,  0,  1,  -1, False),
+    (ChallengeIcon.CREST,     0,  1,  0,  -1, False),
+    (ChallengeIcon.MOUNTAIN,  0,  -1, 0,  1,  False),
+)
+
+
 def _build_challenge_deck() -> list[ChallengeCard]:
     """Build the standard 24-card challenge deck."""
-    card_0 =  ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: 0,  Aspect.FIT: -2, Aspect.SPI: 1,  Aspect.FOC: 1},  True)
-    card_1 =  ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: 0,  Aspect.FIT: -1, Aspect.SPI: 1,  Aspect.FOC: 0},  False)
-    card_2 =  ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: -1, Aspect.FIT: 0,  Aspect.SPI: 0,  Aspect.FOC: -1}, False)
-    card_3 =  ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: -1, Aspect.FIT: 0,  Aspect.SPI: -1, Aspect.FOC: 0},  False)
-    card_4 =  ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: 1,  Aspect.FIT: 1,  Aspect.SPI: -2, Aspect.FOC: 0},  True)
-    card_5 =  ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 1,  Aspect.FIT: -1, Aspect.SPI: -1, Aspect.FOC: 1},  False)
-    card_6 =  ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: -1, Aspect.FIT: 0,  Aspect.SPI: 0,  Aspect.FOC: 1},  False)
-    card_7 =  ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: 0,  Aspect.FIT: -1, Aspect.SPI: 0,  Aspect.FOC: -1}, False)
-    card_8 =  ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: 0,  Aspect.FIT: 0,  Aspect.SPI: -1, Aspect.FOC: -1}, False)
-    card_9 =  ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: -1, Aspect.FIT: 1,  Aspect.SPI: 1,  Aspect.FOC: -1}, False)
-    card_10 = ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: 1,  Aspect.FIT: 0,  Aspect.SPI: 0,  Aspect.FOC: -1}, False)
-    card_11 = ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: 1,  Aspect.FIT: 0,  Aspect.SPI: 1,  Aspect.FOC: -2}, True)
-    card_12 = ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 1,  Aspect.FIT: -1, Aspect.SPI: 0,  Aspect.FOC: 0},  False)
-    card_13 = ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: -2, Aspect.FIT: 1,  Aspect.SPI: 0,  Aspect.FOC: 1},  True)
-    card_14 = ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: 0,  Aspect.FIT: 1,  Aspect.SPI: -1, Aspect.FOC: 0},  False)
-    card_15 = ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 1,  Aspect.FIT: 0,  Aspect.SPI: -1, Aspect.FOC: 0},  False)
-    card_16 = ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 0,  Aspect.FIT: -1, Aspect.SPI: -1, Aspect.FOC: 0},  False)
-    card_17 = ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: -1, Aspect.FIT: 1,  Aspect.SPI: 0,  Aspect.FOC: 0},  False)
-    card_18 = ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: 0,  Aspect.FIT: 0,  Aspect.SPI: -1, Aspect.FOC: 1},  False)
-    card_19 = ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: -1, Aspect.FIT: -1, Aspect.SPI: 0,  Aspect.FOC: 0},  False)
-    card_20 = ChallengeCard(ChallengeIcon.SUN,      {Aspect.AWA: -1, Aspect.FIT: 0,  Aspect.SPI: 1,  Aspect.FOC: 0},  False)
-    card_21 = ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 0,  Aspect.FIT: 0,  Aspect.SPI: 1,  Aspect.FOC: -1}, False)
-    card_22 = ChallengeCard(ChallengeIcon.CREST,    {Aspect.AWA: 0,  Aspect.FIT: 1,  Aspect.SPI: 0,  Aspect.FOC: -1}, False)
-    card_23 = ChallengeCard(ChallengeIcon.MOUNTAIN, {Aspect.AWA: 0,  Aspect.FIT: -1, Aspect.SPI: 0,  Aspect.FOC: 1},  False)
-    return [card_0, card_1, card_2, card_3, card_4, card_5, card_6, card_7, card_8, card_9, card_10, card_11, card_12,
-            card_13, card_14, card_15, card_16, card_17, card_18, card_19, card_20, card_21, card_22, card_23]
+    return [ChallengeCard(icon, {Aspect.AWA: awa, Aspect.FIT: fit, Aspect.SPI: spi, Aspect.FOC: foc}, reshuffle)
+            for icon, awa, fit, spi, foc, reshuffle in _CHALLENGE_DECK_SPEC]
 
 
 # Core data structures: pure state and card data
@@ -328,8 +340,9 @@ class Card:
     id: str = ""  # Will be auto-generated in __post_init__ if empty
     card_set: str = ""
     flavor_text: str = ""
-    art_description: str | None = None #textual description of card art for accessibility and LLM context
-    card_types: set[CardType] = field(default_factory=lambda: set())
+    art_description: ClassVar[str | None] = None #textual description of card art for accessibility and LLM context; set per card class
+    double_sided: ClassVar[bool] = False #cards with a printed second side link their own backside instead of getting a FacedownCard
+    card_types: frozenset[CardType] = field(default_factory=lambda: frozenset()) #printed types never change; sets passed in are frozen in __post_init__
     traits: set[str] = field(default_factory=lambda: set()) #mutable from cards like Trails Markers
     keywords: set[Keyword] = field(default_factory=lambda: set())
     abilities_text: list[str] = field(default_factory=lambda: cast(list[str], [])) #will be mutable in expansion content (mycileal). includes keywords, tests, rules, and challenge effects
@@ -375,14 +388,16 @@ class Card:
     def __post_init__(self):
         """Generate readable instance ID if not provided"""
         if not self.id:
-            safe_title = self.title.lower().replace(" ", "-").replace("'", "")
-            short_uuid = str(uuid.uuid4())[:4]
-            self.id = f"{safe_title}-{short_uuid}"
+            short_uuid = uuid.uuid4().hex[:4]
+            self.id = f"{_id_prefix(self.title)}-{short_uuid}"
         
+        if not isinstance(self.card_types, frozenset):
+            self.card_types = frozenset(self.card_types)
+
         if self.starting_tokens:
             self.unique_tokens = {self.starting_tokens[0]: self.starting_tokens[1]}
         
-        if self.backside is None:
+        if self.backside is None and not self.double_sided:
             self.backside = FacedownCard(self)
     
     def __str__(self):
@@ -393,7 +408,15 @@ class Card:
 
         Each handler receives the engine and returns True if the effect resolved
         (changed game state), False otherwise. Used by the engine to determine
-        resolution order and whether to prompt the player."""
+        resolution order and whether to prompt the player. Subclasses override
+        _build_challenge_handlers; its result is built once per card and reused."""
+        return self._challenge_handlers
+
+    @cached_property
+    def _challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
+        return self._build_challenge_handlers()
+
+    def _build_challenge_handlers(self) -> dict[ChallengeIcon, Callable[[GameEngine], bool]] | None:
         return None
 
     def get_tests(self) -> list[Action] | None:
@@ -403,6 +426,26 @@ class Card:
         drawing a challenge card, and resolving success/failure effects."""
         return None
 
+    def _cached_tests(self, build: Callable[[], list[Action]]) -> list[Action]:
+        """Memoize the result of build() as this card's tests.
+        Built lazily and rebuilt when the card's id no longer matches, since ids can be
+        reassigned after construction (save/load, collection checkout)"""
+        tests: list[Action] | None = getattr(self, "_tests", None)
+        if not tests or tests[0].source_id != self.id:
+            tests = self._tests = build()
+        return tests
+
+    def _cached_listeners(self, build: Callable[[], list[EventListener]]) -> list[EventListener]:
+        """Memoize the result of build() as this card's listeners, like _cached_tests"""
+        listeners: list[EventListener] | None = getattr(self, "_listeners", None)
+        if not listeners or listeners[0].source_card_id != self.id:
+            listeners = self._listeners = build()
+        return listeners
+
+    def target_self(self, _state: GameState) -> list[Card]:
+        """target_provider for tests whose only target is this card itself"""
+        return [self]
+
     def get_exhaust_abilities(self) -> list[Action] | None:
         """Return Actions for this card's 'Exhaust:' abilities.
 
@@ -656,15 +699,13 @@ class Card:
         card-specific constant abilities like presence modification or fatigue prevention."""
         if self.keywords:
             result: list[ConstantAbility] = []
-            for keyword in self.keywords:
-                if keyword == Keyword.OBSTACLE:
-                    result.append(ConstantAbility(ConstantAbilityType.PREVENT_INTERACTION_PAST,
-                                                  self.id,
-                                                  lambda _s, _c: self.is_ready()))
-                    result.append(ConstantAbility(ConstantAbilityType.PREVENT_TRAVEL,
-                                                  self.id,
-                                                  lambda _s, _c: self.is_ready()))
-                
+            if Keyword.OBSTACLE in self.keywords:
+                result.append(ConstantAbility(ConstantAbilityType.PREVENT_INTERACTION_PAST,
+                                              self.id,
+                                              lambda _s, _c: self.is_ready()))
+                result.append(ConstantAbility(ConstantAbilityType.PREVENT_TRAVEL,
+                                              self.id,
+                                              lambda _s, _c: self.is_ready()))
             return result
         else:
             return None
@@ -686,8 +727,11 @@ class Card:
     
     def has_trait(self, trait: str) -> bool:
         #TODO: take into account added traits from stuff like Trail Makers
+        if trait in self.traits: #exact-case hit is the common case; skip the casefold scan
+            return True
+        folded = trait.casefold()
         for candidate_trait in self.traits:
-            if candidate_trait.casefold() == trait.casefold():
+            if candidate_trait.casefold() == folded:
                 return True
         return False
     
@@ -840,7 +884,7 @@ class Card:
         """Parameter "action target" is given for cards played with the Play Action, and is otherwise None"""
 
         #Messaging
-        engine.add_message(f"{get_display_id(engine.state.all_cards_in_play(), self)} enters play in {area.value}.")
+        engine.add_message(lambda: f"{engine.state.get_display_id(self)} enters play in {area.value}.")
         from .view import _show_art_descriptions
         if self.art_description and _show_art_descriptions:
             engine.add_message(f"   Art description: {self.art_description}")
@@ -878,13 +922,14 @@ class Card:
             #first, get just the card's own presence modifiers
             presence_mods = [mod for mod in self.modifiers if mod.target == "presence"]
             #then, we get presence modifiers from Constant Abilities (only MODIFY_PRESENCE, not all abilities)
-            presence_mods.extend([ability.modifier for ability in engine.constant_abilities
-                                  if ability.ability_type == ConstantAbilityType.MODIFY_PRESENCE
-                                  and ability.condition_fn(engine.state, self) and ability.modifier is not None])
+            presence_mods.extend(ability.modifier for ability in engine.get_constant_abilities_by_type(ConstantAbilityType.MODIFY_PRESENCE)
+                                 if ability.condition_fn(engine.state, self) and ability.modifier is not None)
+            if not presence_mods:
+                return self.presence
             #then, we apply modifiers in order of largest minimums first
-            sorted_by_mins = sorted(presence_mods, key=lambda m: m.minimum_result, reverse=True)
+            presence_mods.sort(key=lambda m: m.minimum_result, reverse=True)
             current_presence = self.presence
-            for mod in sorted_by_mins:
+            for mod in presence_mods:
                 current_presence = max(mod.minimum_result, current_presence + mod.amount)
             return current_presence
         else:
@@ -892,11 +937,14 @@ class Card:
     
     def harm_from_predator(self, engine: GameEngine, symbol: ChallengeIcon, harm_target: Card) -> bool:
         """Common challenge effect where an active predator exhausts and adds harm to a harm_target (usually this card)"""
-        predators = engine.state.get_in_play_cards_by_trait("Predator")
-        self_display_id = engine.get_display_id_cached(self)
-        harm_target_display_id = engine.get_display_id_cached(harm_target)
-        if predators:
-            active_predators = [predator for predator in predators if predator.is_ready()]
+        #display ids are only needed for messages, which are off during challenge dry runs
+        if engine.messages_enabled:
+            self_display_id = engine.get_display_id_cached(self)
+            harm_target_display_id = engine.get_display_id_cached(harm_target)
+        else:
+            self_display_id, harm_target_display_id = self.title, harm_target.title
+        if engine.state.count_in_play_cards_by_trait("Predator"):
+            active_predators = engine.state.get_ready_in_play_cards_by_trait("Predator")
             if not active_predators:
                 engine.add_message(f"Challenge ({symbol.value}) on {self_display_id}: (no active predators in play)")
                 return False
@@ -922,11 +970,14 @@ class Card:
     def harm_from_prey(self, engine: GameEngine, symbol: ChallengeIcon, harm_target: Card) -> bool:
         """Common challenge effect form where an active prey exhausts and adds harm to a harm_target (usually this card),
         as well as progress to itself."""
-        prey_list = engine.state.get_in_play_cards_by_trait("Prey")
-        self_display_id = engine.get_display_id_cached(self)
-        harm_target_display_id = engine.get_display_id_cached(harm_target)
-        if prey_list:
-            active_prey = [prey for prey in prey_list if prey.is_ready()]
+        #display ids are only needed for messages, which are off during challenge dry runs
+        if engine.messages_enabled:
+            self_display_id = engine.get_display_id_cached(self)
+            harm_target_display_id = engine.get_display_id_cached(harm_target)
+        else:
+            self_display_id, harm_target_display_id = self.title, harm_target.title
+        if engine.state.count_in_play_cards_by_trait("Prey"):
+            active_prey = engine.state.get_ready_in_play_cards_by_trait("Prey")
             if not active_prey:
                 engine.add_message(f"Challenge ({symbol.value}) on {self_display_id}: (no active prey in play)")
                 return False
@@ -1009,15 +1060,18 @@ class Card:
     def ready(self, engine: GameEngine) -> str:
         """Un-exhaust this card, unless blocked by a PREVENT_READYING constant ability
         from the card it is attached to (e.g. Caustic Mulcher)."""
-        blocker_abilities: list[ConstantAbility] = engine.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_READYING)
-        blocker_ids = [blocker_ability.source_card_id for blocker_ability in blocker_abilities if blocker_ability.is_active(engine.state, self)]
         if self.is_ready():
             return f"{self.title} is already ready."
-        elif self.attached_to_id in blocker_ids:
+        #only an attachment can be held exhausted, so skip the blocker scan for everything else
+        blocker_ids: list[str] = []
+        if self.attached_to_id is not None:
+            blocker_abilities: list[ConstantAbility] = engine.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_READYING)
+            blocker_ids = [blocker_ability.source_card_id for blocker_ability in blocker_abilities if blocker_ability.is_active(engine.state, self)]
+        if self.attached_to_id in blocker_ids:
             blocker = engine.state.get_card_by_id(self.attached_to_id)
             if blocker is None:
                 raise RuntimeError(f"{self.title} has a non-None attached_to_id that refers to no card in play.")
-            blocker_display = get_display_id(engine.state.all_cards_in_play(), blocker)
+            blocker_display = engine.state.get_display_id(blocker)
             return f"{self.title} cannot be readied due to {blocker_display}."
         else:
             self.exhausted = False
@@ -1032,16 +1086,16 @@ class Card:
         if self.has_type(CardType.LOCATION):
             return None #locations never clear
         
-        prog_threshold = self.get_progress_threshold()
-        harm_threshold = self.get_harm_threshold()
-
-        if self.progress_clears_by_ranger_tokens and state.ranger.ranger_token_location==self.id:
-            return "progress"
-        if self.harm_clears_by_ranger_tokens and state.ranger.ranger_token_location==self.id:
-            return "harm"
+        if state.ranger.ranger_token_location == self.id:
+            if self.progress_clears_by_ranger_tokens:
+                return "progress"
+            if self.harm_clears_by_ranger_tokens:
+                return "harm"
 
+        prog_threshold = self.get_progress_threshold()
         if prog_threshold is not None and self.progress >= prog_threshold:
             return "progress"
+        harm_threshold = self.get_harm_threshold()
         if harm_threshold is not None and self.harm >= harm_threshold:
             return "harm"
         return None
@@ -1070,10 +1124,9 @@ class Card:
                     card.discard_from_play(engine)
 
         # Remove from area
-        for area_cards in engine.state.areas.values():
-            if self in area_cards:
-                area_cards.remove(self)
-                break
+        area = engine.state.get_card_area_by_id(self.id)
+        if area is not None:
+            remove_by_identity(engine.state.areas[area], self)
 
         # Determine correct discard pile
         if self.has_type(CardType.PATH):
@@ -1121,7 +1174,7 @@ class Card:
             raise RuntimeError(f"All cards should have a backside!")
         
         #can't use discard_from_play because flipping a card facedown retains its tokens/attachments and doesn't go in discard piles
-        engine.state.areas[current_area].remove(self)
+        remove_by_identity(engine.state.areas[current_area], self)
         engine.remove_constant_abilities_by_id(self.id)
         engine.remove_listeners_by_id(self.id)
 
@@ -1213,34 +1266,42 @@ class RangerState:
         """Calculate total effort from energy + approach icons on committed hand cards.
 
         Returns (total_effort, valid_indices) where valid_indices are the hand
-        positions that actually contributed icons to the committed effort."""
+        positions that actually contributed icons to the committed effort, in
+        ascending order and without repeats, whatever order they were chosen in."""
         total = decision.energy
         valid_indices : list[int] = []
-        for idx in decision.hand_indices:
-            if not (0 <= idx < len(self.hand)):
-                continue
-            c: Card = self.hand[idx]
-            num_icons = c.approach_icons.get(approach, 0)
+        hand = self.hand
+        if not decision.hand_indices or not hand:
+            return total, valid_indices
+        #out-of-range positions are dropped up front rather than bounds-checked per card
+        append = valid_indices.append
+        for idx in sorted(set(decision.hand_indices).intersection(range(len(hand)))):
+            num_icons = hand[idx].approach_icons.get(approach)
             if num_icons:
                 total += num_icons
-                valid_indices.append(idx)
+                append(idx)
         return total, valid_indices
 
     def discard_committed(self, engine: GameEngine, committed_indices: list[int]) -> list[Card]:
-        """Discard cards committed to a test and return the list of committed cards"""
-        cards_to_discard : list[Card] = []
-        for i in sorted(committed_indices, reverse=True):
-            cards_to_discard.append(self.hand[i])
-
+        """Discard cards committed to a test and return the list of committed cards.
+        committed_indices must be ascending and unique, as returned by commit_icons"""
+        if not committed_indices:
+            return []
+        hand = self.hand
+        #discarded highest index first, matching the order cards used to be popped in
+        cards_to_discard : list[Card] = [hand[i] for i in reversed(committed_indices)]
+        committed = set(committed_indices)
+        hand[:] = [card for i, card in enumerate(hand) if i not in committed]
+        self.discard.extend(cards_to_discard)
+        # Remove any listeners associated with these cards
         for card in cards_to_discard:
-            self.discard_from_hand(engine, card)
+            engine.remove_listeners_by_id(card.id)
 
         return cards_to_discard
 
     def discard_from_hand(self, engine: GameEngine, card: Card) -> None:
         """Move a card from hand to discard pile and clean up its listeners"""
-        if card in self.hand:
-            self.hand.remove(card)
+        if remove_by_identity(self.hand, card, missing_ok=True):
             self.discard.append(card)
             # Remove any listeners associated with this card
             engine.remove_listeners_by_id(card.id)
@@ -1248,8 +1309,7 @@ class RangerState:
     def hand_to_limbo(self, engine: GameEngine, card: Card) -> None:
         """Used exclusively by Moments when played. Moments exist in 'limbo'
         (no play area) while their effects are solving, then go to discard."""
-        if card in self.hand:
-            self.hand.remove(card)
+        if remove_by_identity(self.hand, card, missing_ok=True):
             # Remove any listeners associated with this card
             engine.remove_listeners_by_id(card.id)
     
@@ -1269,9 +1329,11 @@ class RangerState:
             engine.end_day(False)
             return
 
-        for _ in range(amount):
-            card = self.deck.pop(0)  # Take from top of deck
-            self.fatigue_stack.insert(0, card)  # Insert at top of fatigue pile
+        # Cards move one at a time, so the last card taken from the deck ends up on top
+        moved = self.deck[:amount]
+        del self.deck[:amount]
+        moved.reverse()
+        self.fatigue_stack[:0] = moved
 
         if amount > 0:
             engine.add_message(f"Ranger suffers {amount} fatigue.")
@@ -1281,8 +1343,9 @@ class RangerState:
         cards_to_soothe = min(amount, len(self.fatigue_stack))
         if cards_to_soothe > 0:
             engine.add_message(f"Ranger soothes {cards_to_soothe} fatigue.")
-        for _ in range(cards_to_soothe):
-            card = self.fatigue_stack.pop(0)  # Take from top of fatigue pile
+        moved = self.fatigue_stack[:cards_to_soothe]  # Take from top of fatigue pile
+        del self.fatigue_stack[:cards_to_soothe]
+        for card in moved:
             self.hand.append(card)  # Add to hand
             engine.add_message(f"   {card.title} is added to your hand.")
             engine.register_listeners(card.enters_hand(engine))
@@ -1320,6 +1383,62 @@ class Mission:
     middle_bubble: bool = False
     right_bubble: bool = False
 
+@dataclass
+class InPlayIndex:
+    """Lookup tables derived from GameState.areas.
+
+    Area lists are mutated directly throughout the engine, cards, and tests, so instead of
+    hooking every mutation the index remembers exactly which cards were in each area when it
+    was built and is rebuilt whenever that no longer matches (see GameState.get_in_play_index).
+
+    Only area membership and order are validated. A card's title, traits, and types are read
+    when the index is built and assumed fixed while the card is in play; an effect that changes
+    them on an in-play card (e.g. granting a trait) must reset GameState.in_play_index to None."""
+    snapshot: list[tuple[Area, list[Card], tuple[Card, ...]]]
+    order: dict[str, int] #card id -> position in all_cards_in_play()
+    by_id: dict[str, Card]
+    area_by_id: dict[str, Area]
+    by_title: dict[str, list[Card]]
+    by_trait: dict[str, list[Card]] #casefolded trait -> cards
+    by_type: dict[CardType, list[Card]]
+    display_ids: dict[str, str] = field(default_factory=lambda: cast(dict[str, str], {})) #card id -> display id, filled on demand
+    #icon -> area -> cards with a handler for that icon, filled on demand
+    challenge_cards: dict[ChallengeIcon, dict[Area, list[Card]]] = field(
+        default_factory=lambda: cast(dict[ChallengeIcon, dict[Area, list[Card]]], {}))
+
+    @classmethod
+    def build(cls, areas: dict[Area, list[Card]]) -> InPlayIndex:
+        snapshot = [(area, cards, tuple(cards)) for area, cards in areas.items()]
+        order: dict[str, int] = {}
+        by_id: dict[str, Card] = {}
+        area_by_id: dict[str, Area] = {}
+        by_title: dict[str, list[Card]] = {}
+        by_trait: dict[str, list[Card]] = {}
+        by_type: dict[CardType, list[Card]] = {}
+        for area, _cards, cards in snapshot:
+            for card in cards:
+                order[card.id] = len(order)
+                by_id.setdefault(card.id, card)
+                area_by_id.setdefault(card.id, area)
+                by_title.setdefault(card.title, []).append(card)
+                for trait in {trait.casefold() for trait in card.traits}:
+                    by_trait.setdefault(trait, []).append(card)
+                for card_type in card.card_types:
+                    by_type.setdefault(card_type, []).append(card)
+        return cls(snapshot, order, by_id, area_by_id, by_title, by_trait, by_type)
+
+    def matches(self, areas: dict[Area, list[Card]]) -> bool:
+        """True if every area still holds the same card objects, in the same order"""
+        if len(areas) != len(self.snapshot):
+            return False
+        for (area, cards), (snap_area, snap_list, snap_cards) in zip(areas.items(), self.snapshot):
+            if area is not snap_area or len(cards) != len(snap_cards):
+                return False
+            if cards is not snap_list or not all(map(operator.is_, cards, snap_cards)):
+                return False
+        return True
+
+
 @dataclass
 class GameState:
     ranger: RangerState
@@ -1343,6 +1462,9 @@ class GameState:
 
     # Per-day state (resets each day)
     round_number: int = 1
+
+    # Derived lookup tables over cards in play; see get_in_play_index()
+    in_play_index: InPlayIndex | None = field(default=None, init=False, repr=False, compare=False)
     
 
     def __post_init__(self) -> None:
@@ -1382,9 +1504,57 @@ class GameState:
         """Get all cards across all areas"""
         return [card for cards in self.areas.values() for card in cards]
     
+    def get_in_play_index(self) -> InPlayIndex:
+        """Get the title/trait/type lookup tables for cards in play, rebuilding them if any area changed"""
+        index = self.in_play_index
+        if index is None or not index.matches(self.areas):
+            index = InPlayIndex.build(self.areas)
+            self.in_play_index = index
+        return index
+
+    def get_display_id(self, card: Card) -> str:
+        """Get a card's display ID among the cards in play, memoized until an area changes"""
+        index = self.get_in_play_index()
+        display_id = index.display_ids.get(card.id)
+        if display_id is None or card.id not in index.order:
+            display_id = get_display_id(index.by_title.get(card.title, []), card)
+            if card.id in index.order:
+                index.display_ids[card.id] = display_id
+        return display_id
+
+    def get_display_ids(self) -> dict[str, str]:
+        """Get the display IDs of every card in play, keyed by card id, from one index lookup"""
+        index = self.get_in_play_index()
+        display_ids = index.display_ids
+        if len(display_ids) < len(index.order):
+            for same_title in index.by_title.values():
+                for card in same_title:
+                    if card.id not in display_ids:
+                        display_ids[card.id] = get_display_id(same_title, card)
+        return dict(display_ids)
+
+    def _challenge_cards_by_area(self, icon: ChallengeIcon) -> dict[Area, list[Card]]:
+        index = self.get_in_play_index()
+        by_area = index.challenge_cards.get(icon)
+        if by_area is None:
+            by_area = {}
+            for snap_area, _cards, cards in index.snapshot:
+                by_area[snap_area] = [card for card in cards
+                                      if icon in (card.get_challenge_handlers() or ())]
+            index.challenge_cards[icon] = by_area
+        return by_area
+
+    def get_cards_with_challenge_handler(self, icon: ChallengeIcon, area: Area) -> list[Card]:
+        """Get the cards in an area that have a challenge handler for the given icon, ready or not"""
+        return list(self._challenge_cards_by_area(icon).get(area, ()))
+
+    def has_challenge_handler(self, icon: ChallengeIcon) -> bool:
+        """Whether any card in play has a challenge handler for the given icon, ready or not"""
+        return any(self._challenge_cards_by_area(icon).values())
+
     def cards_by_type(self, card_type: CardType) -> list[Card]:
         """Get all cards of a specific type"""
-        return [card for card in self.all_cards_in_play() if card_type in card.card_types]
+        return list(self.get_in_play_index().by_type.get(card_type, ()))
     
     def path_cards_in_play(self) -> list[Card]:
         """Get all path cards (beings and features) in play"""
@@ -1410,47 +1580,65 @@ class GameState:
 
     def get_card_by_id(self, card_id: str | None) -> Card | None:
         """Get a specific card by its instance ID"""
-        all_cards = self.get_all_cards()
-        return next((c for c in all_cards if c.id == card_id), None)
+        if card_id is None:
+            return None
+        in_play = self.get_in_play_index().by_id.get(card_id)
+        if in_play is not None:
+            return in_play
+        out_of_play = chain(self.path_deck, self.path_discard, self.ranger.hand,
+                            self.ranger.discard, self.ranger.deck, self.ranger.fatigue_stack)
+        return next((c for c in out_of_play if c.id == card_id), None)
     
     def get_card_by_title(self, title: str) -> Card | None:
-        all_cards = self.get_all_cards()
-        return next((c for c in all_cards if c.title == title), None)
+        in_play = self.get_in_play_index().by_title.get(title)
+        if in_play:
+            return in_play[0]
+        out_of_play = chain(self.path_deck, self.path_discard, self.ranger.hand,
+                            self.ranger.discard, self.ranger.deck, self.ranger.fatigue_stack)
+        return next((c for c in out_of_play if c.title == title), None)
     
     def get_card_area_by_id(self, card_id: str | None) -> Area | None:
         """Get a card's current area by its instance ID"""
-        for area in self.areas:
-            for card in self.areas[area]:
-                if card.id == card_id:
-                    return area
-        return None
+        if card_id is None:
+            return None
+        return self.get_in_play_index().area_by_id.get(card_id)
     
     def get_in_play_card_by_id(self, id: str) -> Card | None:
-        for area in self.areas:
-            for card in self.areas[area]:
-                if card.id == id:
-                    return card
-        return None
+        return self.get_in_play_index().by_id.get(id)
     
     def get_in_play_cards_by_title(self, title: str) -> list[Card]:
         """Get all in-play cards of a given title"""
-        results: list[Card] = []
-        for area in self.areas:
-            for card in self.areas[area]:
-                if card.title == title:
-                    results.append(card)
-        return results
+        return list(self.get_in_play_index().by_title.get(title, ()))
     
     def get_in_play_cards_by_trait(self, trait: str) -> list[Card]:
         """Get all in-play cards with a given trait"""
-        results: list[Card] = []
-        for area in self.areas:
-            for card in self.areas[area]:
-                for curr_trait in card.traits: #TODO: take into account added traits from cards like Trail Marker
-                    if trait.casefold() == curr_trait.casefold():
-                        results.append(card)
-                
-        return results
+        return list(self.get_in_play_index().by_trait.get(trait.casefold(), ()))
+
+    #readiness isn't indexed: exhausting a card flips a flag without touching the areas
+    def get_ready_in_play_cards_by_title(self, title: str) -> list[Card]:
+        """Get all ready in-play cards of a given title"""
+        return [card for card in self.get_in_play_index().by_title.get(title, ()) if card.is_ready()]
+
+    def get_ready_in_play_cards_by_trait(self, trait: str) -> list[Card]:
+        """Get all ready in-play cards with a given trait"""
+        return [card for card in self.get_in_play_index().by_trait.get(trait.casefold(), ()) if card.is_ready()]
+
+    def count_in_play_cards_by_trait(self, trait: str) -> int:
+        """Count in-play cards with a given trait without building a list"""
+        return len(self.get_in_play_index().by_trait.get(trait.casefold(), ()))
+
+    def get_in_play_cards_by_traits_or_types(self, traits: list[str],
+                                             card_types: list[CardType]) -> list[Card]:
+        """Get all in-play cards having any of the given traits or card types, in play order"""
+        index = self.get_in_play_index()
+        matches: dict[str, Card] = {}
+        for trait in traits:
+            for card in index.by_trait.get(trait.casefold(), ()):
+                matches[card.id] = card
+        for card_type in card_types:
+            for card in index.by_type.get(card_type, ()):
+                matches[card.id] = card
+        return sorted(matches.values(), key=lambda card: index.order[card.id])
 
     def get_cards_between_ranger_and_target(self, target: Card) -> list[Card]:
         """Get all cards 'between' the ranger and a target for interaction fatigue.
@@ -1486,6 +1674,13 @@ class GameState:
 
 # Action system: derived from state; executed by engine.
 
+@cache
+def fixed_difficulty(value: int) -> Callable[[GameEngine, Card | None], int]:
+    """Shared difficulty_fn for tests with a constant printed difficulty, one per value"""
+    def difficulty(_engine: GameEngine, _target: Card | None) -> int:
+        return value
+    return difficulty
+
 @dataclass
 class Action:
     id: str  # stable identifier for the action option
@@ -1506,16 +1701,25 @@ class Action:
     # Source metadata (for display/tracking)
     source_id: Optional[str] = None  # card/entity id or "common"
     source_title: Optional[str] = None
+    #casefolded verb, computed once for listener matching in trigger_listeners
+    verb_key: str | None = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self.verb_key = self.verb.casefold() if self.verb is not None else None
+        if self.is_test:
+            #normalized once here so the test sequence can rely on enum values
+            self.aspect = Aspect(self.aspect)
+            self.approach = Approach(self.approach)
 
-@dataclass
+
+@dataclass(slots=True)
 class CommitDecision:
     # Amount of energy committed
     energy: int = 1
     # Indices into the ranger.hand to commit for icons
     hand_indices: list[int] = field(default_factory=lambda: cast(list[int], []))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MessageEvent:
     # Message to print to player
     message: str = field(default_factory=lambda:cast(str, ""))
@@ -1529,6 +1733,11 @@ class EventListener:
     source_card_id: str
     timing_type: TimingType
     test_type: str | None = None #"Traverse", "Connect", etc.
+    #casefolded test_type, computed once for verb matching in trigger_listeners
+    test_type_key: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.test_type_key = self.test_type.casefold() if self.test_type is not None else None
 
 @dataclass
 class ConstantAbility:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from .models import GameState, Action, Aspect, Approach, CardType, Card
+from .models import GameState, Action, Aspect, Approach, CardType, Card, fixed_difficulty
 from .engine import GameEngine
 
 
@@ -114,7 +114,7 @@ def provide_common_tests(state: GameState) -> list[Action]:
             approach=Approach.REASON,
             verb="Remember",
             target_provider=None,
-            difficulty_fn=lambda _s, _t: 1,
+            difficulty_fn=fixed_difficulty(1),
             on_success=remember_success, 
             source_id="common",
             source_title="Common Test",
@@ -210,10 +210,9 @@ def display_and_clear_messages(engine: GameEngine) -> None:
     inside the Messages panel rather than as plaintext below the dashboard.
     """
     has_new = False
-    for event in engine.get_messages():
+    for event in engine.drain_messages():
         _pending_messages.append(event.message)
         has_new = True
-    engine.clear_messages()
     if has_new:
         render_state(engine, _last_phase_header)
 
@@ -234,9 +233,7 @@ def render_state(engine: GameEngine, phase_header: str = "") -> None:
     _last_phase_header = phase_header or _last_phase_header
 
     # Drain any un-flushed engine messages into the buffer before rendering
-    for event in engine.get_messages():
-        _pending_messages.append(event.message)
-    engine.clear_messages()
+    _pending_messages.extend(event.message for event in engine.drain_messages())
 
     console.clear()
 
@@ -279,9 +276,7 @@ def render_state(engine: GameEngine, phase_header: str = "") -> None:
 def choose_action(actions: list[Action], state: GameState, engine: GameEngine) -> Optional[Action]:
     """Rich-mode choose_action: render dashboard with actions in the Event Log."""
     # Buffer any pending engine messages
-    for event in engine.get_messages():
-        _pending_messages.append(event.message)
-    engine.clear_messages()
+    _pending_messages.extend(event.message for event in engine.drain_messages())
 
     if not actions:
         _pending_messages.append("No actions available.")
@@ -15,7 +15,7 @@ from pathlib import Path
 
 from .models import (
     Card, RangerState, GameState, CampaignTracker, ChallengeDeck, ChallengeCard,
-    Aspect, Area, ChallengeIcon, CardType, Mission, FacedownCard, ValueModifier
+    Aspect, Area, ChallengeIcon, Mission, FacedownCard, ValueModifier
 )
 
 if TYPE_CHECKING:
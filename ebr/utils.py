@@ -25,3 +25,15 @@ def get_display_id(cards_in_context: list[Card], card: Card) -> str:
     index = sorted_cards.index(card)
     letter = chr(65 + index)  # 65 is 'A' in ASCII
     return f"{card.title} {letter}"
+
+
+def remove_by_identity(cards: list[Card], card: Card, missing_ok: bool = False) -> bool:
+    """list.remove by identity; Card is a dataclass, so == would compare every field.
+    Returns whether the card was removed; a missing card raises unless missing_ok."""
+    for i, candidate in enumerate(cards):
+        if candidate is card:
+            del cards[i]
+            return True
+    if missing_ok:
+        return False
+    raise ValueError(f"{card.title} is not in this area")
@@ -696,6 +696,5 @@ def choose_commit(action: Action, hand_size: int, state: GameState, engine: Game
 
 def display_and_clear_messages(engine: GameEngine) -> None:
     """Display and clear messages from the game engine"""
-    for event in engine.get_messages():
-        print(event.message)
-    engine.clear_messages()
\ No newline at end of file
+    for event in engine.drain_messages():
+        print(event.message)
\ No newline at end of file
@@ -549,8 +549,7 @@ def _handle_phase2_action(engine: GameEngine, act: Action, with_ui: bool) -> str
                 input("There was a runtime error! Press Enter to continue...")
             return None
     elif act.is_exhaust or act.is_play:
-        target_card = engine.state.get_card_by_id(target_id)
-        act.on_success(engine, 0, target_card)
+        engine.perform_nontest_action(act, target_id)
     else:
         raise RuntimeError(f"Unknown action type: {act.id}")
 
@@ -2,6 +2,7 @@
 Tests for card creation and loading
 """
 
+import copy
 import unittest
 from ebr.models import *
 from ebr.cards import *
@@ -317,5 +318,20 @@ class CardLoadingTests(unittest.TestCase):
         self.assertEqual(len(sbb.modifiers), 0)
 
 
+class ChallengeHandlerCacheTests(unittest.TestCase):
+    def test_handlers_are_built_once_per_card(self):
+        doe = SitkaDoe()
+        self.assertIs(doe.get_challenge_handlers(), doe.get_challenge_handlers())
+        self.assertIsNot(doe.get_challenge_handlers(), SitkaDoe().get_challenge_handlers())
+
+    def test_deepcopy_rebinds_handlers_to_the_copy(self):
+        tala = TalaTheRedExile()
+        tala.get_challenge_handlers()
+        clone = copy.deepcopy(tala)
+        handlers = clone.get_challenge_handlers()
+        assert handlers is not None
+        self.assertIs(handlers[ChallengeIcon.CREST].__self__, clone)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,9 +3,11 @@ Tests for decks.py — travel destinations, pivotal cards, and registry lookups.
 """
 
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 from ebr.models import Card, CardType, Mission
 from ebr.decks import (
-    get_available_travel_destinations, get_pivotal_cards,
+    build_woods_path_deck, get_available_travel_destinations, get_pivotal_cards,
     get_current_weather, get_current_missions, get_location_by_id
 )
 from ebr.cards import (
@@ -151,5 +153,16 @@ class LocationRegistryTests(unittest.TestCase):
         self.assertIn("Unknown location ID", str(ctx.exception))
 
 
+
+class WoodsPathDeckTests(unittest.TestCase):
+
+    def test_rebuilding_deck_does_not_reread_json(self):
+        first = build_woods_path_deck()
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("woods.json re-read")):
+            second = build_woods_path_deck()
+        self.assertEqual([c.title for c in first], [c.title for c in second])
+        self.assertTrue(all(a is not b for a, b in zip(first, second)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -239,6 +239,37 @@ class ClearingTests(unittest.TestCase):
         self.assertIn(thicket, state.path_discard)
         self.assertIn(bramble, state.path_discard)
 
+    def test_clear_that_discards_another_clearable_card(self):
+        """A card discarded by an earlier clear in the same check is not cleared again"""
+        other = Card(id="y", title="Y", card_types={CardType.PATH, CardType.FEATURE},
+                     progress_threshold=2)
+        other.progress = 2
+
+        class Discarder(Card):
+            def on_progress_clear(self, engine: GameEngine):
+                other.discard_from_play(engine)
+
+        discarder = Discarder(id="x", title="X", card_types={CardType.PATH, CardType.FEATURE},
+                              progress_threshold=2)
+        discarder.progress = 2
+
+        ranger = RangerState(name="Ranger", aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        state = GameState(
+            ranger=ranger,
+            areas={
+                Area.SURROUNDINGS: [],
+                Area.ALONG_THE_WAY: [discarder],
+                Area.WITHIN_REACH: [other],
+                Area.PLAYER_AREA: [],
+            }
+        )
+        eng = GameEngine(state)
+
+        cleared = eng.check_and_process_clears()
+
+        self.assertEqual([c.id for c in cleared], ["x"])
+        self.assertEqual([c.id for c in state.path_discard], ["y", "x"])
+
 
 class SeparationOfClearAndDiscardTests(unittest.TestCase):
     """Tests verifying that clearing and discarding are properly separated"""
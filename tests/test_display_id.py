@@ -1,9 +1,9 @@
 """
-Tests for utils.py — get_display_id disambiguation logic.
+Tests for utils.py — get_display_id disambiguation logic, and its memoized GameState form.
 """
 
 import unittest
-from ebr.models import Card
+from ebr.models import Area, Aspect, Card, GameState, RangerState
 from ebr.utils import get_display_id
 
 
@@ -55,5 +55,30 @@ class GetDisplayIdTests(unittest.TestCase):
         self.assertEqual(get_display_id(context, other), "Sitka Buck")
 
 
+class GameStateDisplayIdTests(unittest.TestCase):
+    """GameState.get_display_id must match get_display_id over the cards in play."""
+
+    def setUp(self):
+        self.card_b = Card(id="bbb", title="Sitka Buck")
+        ranger = RangerState(name="Ranger", aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        self.state = GameState(ranger=ranger, areas={
+            Area.SURROUNDINGS: [],
+            Area.ALONG_THE_WAY: [self.card_b],
+            Area.WITHIN_REACH: [],
+            Area.PLAYER_AREA: [],
+        })
+
+    def test_updates_when_duplicate_enters_play(self):
+        self.assertEqual(self.state.get_display_id(self.card_b), "Sitka Buck")
+        card_a = Card(id="aaa", title="Sitka Buck")
+        self.state.areas[Area.WITHIN_REACH].append(card_a)
+        self.assertEqual(self.state.get_display_id(card_a), "Sitka Buck A")
+        self.assertEqual(self.state.get_display_id(self.card_b), "Sitka Buck B")
+
+    def test_card_out_of_play_uses_title(self):
+        in_hand = Card(id="hand", title="Walk With Me")
+        self.assertEqual(self.state.get_display_id(in_hand), "Walk With Me")
+
+
 if __name__ == "__main__":
     unittest.main()
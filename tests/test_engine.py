@@ -2524,5 +2524,102 @@ class ScoutCardsTests(unittest.TestCase):
         self.assertIs(deck[2], card_b, "Second bottom card should be last")
 
 
+class AddMessageTests(unittest.TestCase):
+    """Tests for add_message: lazy messages and the messages_enabled switch."""
+
+    def _make_engine(self) -> GameEngine:
+        ranger = RangerState(name="Ranger", hand=[], aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        return GameEngine(GameState(ranger=ranger), skip_reconstruct=True)
+
+    def test_callable_message_is_formatted(self):
+        eng = self._make_engine()
+        eng.add_message(lambda: "built lazily")
+        self.assertEqual(eng.message_queue[-1].message, "built lazily")
+
+    def test_disabled_messages_are_never_built(self):
+        eng = self._make_engine()
+        eng.messages_enabled = False
+        before = len(eng.message_queue)
+        calls: list[int] = []
+        eng.add_message(lambda: calls.append(1) or "unused")
+        eng.add_message("plain")
+        self.assertEqual(len(eng.message_queue), before)
+        self.assertEqual(calls, [])
+
+    def test_add_messages_appends_in_order(self):
+        eng = self._make_engine()
+        eng.clear_messages()
+        eng.add_messages(["one", "two"])
+        eng.add_messages(lambda: ("three",))
+        self.assertEqual([event.message for event in eng.message_queue], ["one", "two", "three"])
+        eng.messages_enabled = False
+        eng.add_messages(lambda: self.fail("should not be built"))
+        self.assertEqual(len(eng.message_queue), 3)
+
+    def test_drain_returns_queue_and_empties_it(self):
+        eng = self._make_engine()
+        eng.clear_messages()
+        eng.add_message("first")
+        eng.add_message("second")
+        drained = eng.drain_messages()
+        self.assertEqual([event.message for event in drained], ["first", "second"])
+        self.assertEqual(eng.get_messages(), [])
+        eng.add_message("third")
+        self.assertEqual(len(drained), 2)
+
+
+class ListenerDispatchTests(unittest.TestCase):
+    """Tests for the (event, timing) listener index used by trigger_listeners."""
+
+    def _make_engine(self) -> GameEngine:
+        ranger = RangerState(name="Ranger", hand=[], aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        return GameEngine(GameState(ranger=ranger), skip_reconstruct=True)
+
+    def _listener(self, fired: list[str], name: str, event_type: EventType,
+                  timing_type: TimingType, test_type: str | None = None) -> EventListener:
+        def effect(_eng: GameEngine, _effort: int) -> int:
+            fired.append(name)
+            return 1
+        return EventListener(event_type, lambda _e, _c: True, effect, name, timing_type, test_type)
+
+    def test_only_matching_event_timing_and_verb_fire(self):
+        eng = self._make_engine()
+        fired: list[str] = []
+        eng.register_listeners([
+            self._listener(fired, "traverse", EventType.PERFORM_TEST, TimingType.WHEN, "Traverse"),
+            self._listener(fired, "wildcard", EventType.PERFORM_TEST, TimingType.WHEN),
+            self._listener(fired, "avoid", EventType.PERFORM_TEST, TimingType.WHEN, "Avoid"),
+            self._listener(fired, "after", EventType.PERFORM_TEST, TimingType.AFTER),
+            self._listener(fired, "refresh", EventType.REFRESH, TimingType.WHEN),
+        ])
+        action = Action(id="a", name="a", aspect=Aspect.FIT, approach=Approach.EXPLORATION, verb="traverse")
+        bonus = eng.trigger_listeners(EventType.PERFORM_TEST, TimingType.WHEN, action, 0)
+        self.assertEqual(fired, ["traverse", "wildcard"])
+        self.assertEqual(bonus, 2)
+
+    def test_removed_listeners_no_longer_fire(self):
+        eng = self._make_engine()
+        fired: list[str] = []
+        eng.register_listeners([self._listener(fired, "src", EventType.REFRESH, TimingType.WHEN)])
+        eng.remove_listeners_by_id("src")
+        self.assertEqual(eng.trigger_listeners(EventType.REFRESH, TimingType.WHEN, None, 0), 0)
+        self.assertEqual(fired, [])
+        self.assertEqual(eng.listeners, [])
+
+    def test_constant_abilities_bucketed_by_type(self):
+        eng = self._make_engine()
+        always = lambda _s, _c: True
+        travel_a = ConstantAbility(ConstantAbilityType.PREVENT_TRAVEL, "a", always)
+        travel_b = ConstantAbility(ConstantAbilityType.PREVENT_TRAVEL, "b", always)
+        past_a = ConstantAbility(ConstantAbilityType.PREVENT_INTERACTION_PAST, "a", always)
+        eng.register_constant_abilities([travel_a, past_a])
+        eng.register_constant_abilities([travel_b])
+        self.assertEqual(eng.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_TRAVEL), [travel_a, travel_b])
+        eng.remove_constant_abilities_by_id("a")
+        self.assertEqual(eng.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_TRAVEL), [travel_b])
+        self.assertEqual(eng.get_constant_abilities_by_type(ConstantAbilityType.PREVENT_INTERACTION_PAST), [])
+        self.assertEqual(eng.constant_abilities, [travel_b])
+
+
 if __name__ == '__main__':
     unittest.main()
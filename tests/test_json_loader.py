@@ -7,7 +7,7 @@ from ebr.json_loader import (
     parse_card_types, parse_threshold_value, parse_area, parse_energy_cost,
     parse_approach_icons, parse_aspect_requirement, parse_starting_tokens,
     parse_card_abilities, parse_clear_logs, parse_mission_objective_log,
-    load_card_json_by_title
+    load_card_json_by_title, load_card_fields
 )
 from ebr.models import CardType, Aspect, Approach, Area
 from ebr.cards import (
@@ -139,6 +139,20 @@ class LoadCardJsonErrorTests(unittest.TestCase):
             load_card_json_by_title("Card That Does Not Exist", "explorer")
         self.assertIn("not found", str(ctx.exception))
 
+    def test_set_file_is_read_once(self):
+        first = load_card_json_by_title("Walk With Me", "Explorer")
+        second = load_card_json_by_title("Walk With Me", "explorer")
+        self.assertIs(first, second)
+
+    def test_cached_fields_are_not_shared_between_cards(self):
+        first = load_card_fields("Sitka Doe", "woods")
+        second = load_card_fields("Sitka Doe", "woods")
+        self.assertEqual(first, second)
+        first["traits"].add("Trail Marked")
+        first["keywords"].clear()
+        self.assertNotIn("Trail Marked", second["traits"])
+        self.assertEqual(load_card_fields("Sitka Doe", "woods"), second)
+
 
 # ── Theme 4: parse_threshold_value edge cases ────────────────────────────
 
@@ -1,13 +1,17 @@
 """
-Tests for models.py — challenge deck and day registry data integrity.
+Tests for models.py — challenge deck and day registry data integrity, in-play lookup index,
+ranger piles.
 """
 
+import copy
 import unittest
 from collections import Counter
 from ebr.models import (
     _build_challenge_deck, _default_day_registry,
-    ChallengeIcon, Aspect, ChallengeCard, DayContent
+    Action, ChallengeIcon, Aspect, ChallengeCard, DayContent,
+    Area, Approach, Card, CardType, CommitDecision, GameState, RangerState
 )
+from ebr.engine import GameEngine
 
 
 # ── Theme 1: Challenge deck data integrity ───────────────────────────────
@@ -71,6 +75,12 @@ class ChallengeDeckStructureTests(unittest.TestCase):
             penalized_aspects.add(neg2_aspects[0])
         self.assertEqual(penalized_aspects, {Aspect.AWA, Aspect.FIT, Aspect.SPI, Aspect.FOC})
 
+    def test_deepcopy_shares_cards(self):
+        """Copies of the deck reuse the (never-modified) card objects."""
+        copied = copy.deepcopy(self.deck)
+        self.assertIsNot(copied, self.deck)
+        self.assertTrue(all(a is b for a, b in zip(copied, self.deck)))
+
 
 class ChallengeDeckSpotCheckTests(unittest.TestCase):
     """Pin specific card values to catch data entry mutations."""
@@ -228,5 +238,168 @@ class DayRegistrySpotCheckTests(unittest.TestCase):
         self.assertEqual(self.registry[10].weather, "Downpour")
 
 
+# ── Theme 3: In-play lookup index ────────────────────────────────────────
+
+class InPlayIndexTests(unittest.TestCase):
+    """The title/trait/type index must track direct mutation of the area lists."""
+
+    def setUp(self):
+        self.flora = Card(id="flora", title="Flora", card_types={CardType.PATH, CardType.FEATURE}, traits={"Flora"})
+        self.prey = Card(id="prey", title="Prey", card_types={CardType.PATH, CardType.BEING}, traits={"Mammal", "Prey"})
+        ranger = RangerState(name="Ranger", aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        self.state = GameState(
+            ranger=ranger,
+            areas={
+                Area.SURROUNDINGS: [],
+                Area.ALONG_THE_WAY: [self.flora],
+                Area.WITHIN_REACH: [self.prey],
+                Area.PLAYER_AREA: [],
+            }
+        )
+
+    def test_trait_lookup_is_case_insensitive(self):
+        self.assertEqual(self.state.get_in_play_cards_by_trait("prey"), [self.prey])
+
+    def test_title_lookup_tracks_removal(self):
+        self.assertEqual(self.state.get_in_play_cards_by_title("Prey"), [self.prey])
+        self.state.areas[Area.WITHIN_REACH].clear()
+        self.assertEqual(self.state.get_in_play_cards_by_title("Prey"), [])
+
+    def test_card_by_title_prefers_in_play_then_piles(self):
+        discarded = Card(id="prey-2", title="Prey")
+        self.state.path_discard.append(discarded)
+        self.assertIs(self.state.get_card_by_title("Prey"), self.prey)
+        self.state.areas[Area.WITHIN_REACH].clear()
+        self.assertIs(self.state.get_card_by_title("Prey"), discarded)
+        self.assertIsNone(self.state.get_card_by_title("Nobody"))
+
+    def test_card_by_id_prefers_in_play_then_piles(self):
+        self.assertIs(self.state.get_card_by_id("prey"), self.prey)
+        self.state.areas[Area.WITHIN_REACH].clear()
+        self.state.path_discard.append(self.prey)
+        self.assertIs(self.state.get_card_by_id("prey"), self.prey)
+        self.assertIsNone(self.state.get_card_by_id("nobody"))
+        self.assertIsNone(self.state.get_card_by_id(None))
+
+    def test_trait_count_matches_lookup(self):
+        self.assertEqual(self.state.count_in_play_cards_by_trait("PREY"), 1)
+        self.assertEqual(self.state.count_in_play_cards_by_trait("Predator"), 0)
+
+    def test_ready_lookup_skips_exhausted_cards(self):
+        self.assertEqual(self.state.get_ready_in_play_cards_by_title("Prey"), [self.prey])
+        self.prey.exhaust()
+        self.assertEqual(self.state.get_ready_in_play_cards_by_title("Prey"), [])
+        self.assertEqual(self.state.get_ready_in_play_cards_by_trait("Prey"), [])
+
+    def test_append_invalidates_index(self):
+        self.assertEqual(self.state.beings_in_play(), [self.prey])
+        other = Card(id="other", title="Other", card_types={CardType.BEING}, traits={"Prey"})
+        self.state.areas[Area.SURROUNDINGS].append(other)
+        self.assertEqual(self.state.beings_in_play(), [other, self.prey])
+        self.assertEqual(self.state.get_in_play_cards_by_trait("Prey"), [other, self.prey])
+
+    def test_move_between_areas_keeps_play_order(self):
+        self.state.areas[Area.WITHIN_REACH].remove(self.prey)
+        self.state.areas[Area.SURROUNDINGS].insert(0, self.prey)
+        result = self.state.get_in_play_cards_by_traits_or_types(["Flora"], [CardType.BEING])
+        self.assertEqual(result, [self.prey, self.flora])
+
+    def test_area_and_card_lookup_by_id_track_moves(self):
+        self.assertEqual(self.state.get_card_area_by_id("prey"), Area.WITHIN_REACH)
+        self.assertIs(self.state.get_in_play_card_by_id("prey"), self.prey)
+        self.state.areas[Area.WITHIN_REACH].remove(self.prey)
+        self.state.areas[Area.PLAYER_AREA].append(self.prey)
+        self.assertEqual(self.state.get_card_area_by_id("prey"), Area.PLAYER_AREA)
+        self.state.areas[Area.PLAYER_AREA].clear()
+        self.assertIsNone(self.state.get_card_area_by_id("prey"))
+        self.assertIsNone(self.state.get_in_play_card_by_id("prey"))
+        self.assertIsNone(self.state.get_card_area_by_id(None))
+
+    def test_display_ids_match_single_lookups(self):
+        twin = Card(id="prey-2", title="Prey")
+        self.state.areas[Area.SURROUNDINGS].append(twin)
+        expected = {card.id: self.state.get_display_id(card) for card in self.state.all_cards_in_play()}
+        self.assertEqual(expected["prey"], "Prey A")
+        self.state.in_play_index = None #start from an empty memo
+        self.assertEqual(self.state.get_display_ids(), expected)
+
+    def test_challenge_handler_lookup_tracks_entering_cards(self):
+        class SunWatcher(Card):
+            def get_challenge_handlers(self):
+                return {ChallengeIcon.SUN: lambda _eng: False}
+        self.assertFalse(self.state.has_challenge_handler(ChallengeIcon.SUN))
+        watcher = SunWatcher(id="watcher", title="Watcher")
+        self.state.areas[Area.PLAYER_AREA].append(watcher)
+        self.assertTrue(self.state.has_challenge_handler(ChallengeIcon.SUN))
+        self.assertFalse(self.state.has_challenge_handler(ChallengeIcon.CREST))
+        self.assertEqual(self.state.get_cards_with_challenge_handler(ChallengeIcon.SUN, Area.PLAYER_AREA), [watcher])
+
+    def test_replacing_area_list_invalidates_index(self):
+        self.assertEqual(self.state.features_in_play(), [self.flora])
+        self.state.areas[Area.ALONG_THE_WAY] = []
+        self.assertEqual(self.state.features_in_play(), [])
+
+
+class RangerPileTests(unittest.TestCase):
+    """Fatigue, soothe and committed discards move cards between the ranger's piles."""
+
+    def setUp(self):
+        self.cards = [Card(id=f"c{i}", title=f"Card {i}") for i in range(5)]
+        ranger = RangerState(name="Ranger", deck=list(self.cards),
+                             aspects={Aspect.AWA: 3, Aspect.FIT: 2, Aspect.SPI: 2, Aspect.FOC: 1})
+        self.engine = GameEngine(GameState(ranger=ranger), skip_reconstruct=True)
+        self.ranger = ranger
+
+    def test_fatigue_stacks_last_moved_card_on_top(self):
+        self.ranger.fatigue(self.engine, 3)
+        self.assertEqual(self.ranger.fatigue_stack, [self.cards[2], self.cards[1], self.cards[0]])
+        self.assertEqual(self.ranger.deck, self.cards[3:])
+
+    def test_soothe_takes_from_top_in_order(self):
+        self.ranger.fatigue(self.engine, 3)
+        self.ranger.soothe(self.engine, 2)
+        self.assertEqual(self.ranger.hand, [self.cards[2], self.cards[1]])
+        self.assertEqual(self.ranger.fatigue_stack, [self.cards[0]])
+
+    def test_committed_indices_are_ascending_and_unique(self):
+        self.ranger.hand = [Card(id=f"h{i}", title=f"Hand {i}", approach_icons={Approach.EXPLORATION: 1})
+                            for i in range(3)]
+        effort, committed = self.ranger.commit_icons(Approach.EXPLORATION, CommitDecision(energy=1, hand_indices=[2, 0, 2]))
+        self.assertEqual(committed, [0, 2])
+        self.assertEqual(effort, 3)
+
+    def test_commit_nothing_returns_energy_only(self):
+        self.ranger.hand = []
+        self.assertEqual(self.ranger.commit_icons(Approach.EXPLORATION, CommitDecision(energy=2, hand_indices=[0, 1])), (2, []))
+
+    def test_discard_committed_discards_from_highest_index(self):
+        self.ranger.hand = list(self.cards)
+        committed = self.ranger.discard_committed(self.engine, [1, 3])
+        self.assertEqual(committed, [self.cards[3], self.cards[1]])
+        self.assertEqual(self.ranger.hand, [self.cards[0], self.cards[2], self.cards[4]])
+        self.assertEqual(self.ranger.discard, [self.cards[3], self.cards[1]])
+
+    def test_discard_from_hand_ignores_cards_not_held(self):
+        self.ranger.hand = [self.cards[0]]
+        self.ranger.discard_from_hand(self.engine, self.cards[1])
+        self.assertEqual(self.ranger.discard, [])
+        self.ranger.discard_from_hand(self.engine, self.cards[0])
+        self.assertEqual((self.ranger.hand, self.ranger.discard), ([], [self.cards[0]]))
+
+
+class ActionTests(unittest.TestCase):
+    def test_test_actions_normalize_aspect_and_approach(self):
+        action = Action(id="a", name="a", aspect="FIT", approach="Exploration", verb="Traverse")
+        self.assertIs(action.aspect, Aspect.FIT)
+        self.assertIs(action.approach, Approach.EXPLORATION)
+        self.assertEqual(action.verb_key, "traverse")
+
+    def test_non_test_actions_keep_placeholder_strings(self):
+        action = Action(id="rest", name="Rest", aspect="", approach="", is_test=False)
+        self.assertEqual((action.aspect, action.approach), ("", ""))
+        with self.assertRaises(ValueError):
+            Action(id="bad", name="Bad", aspect="", approach="")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -532,6 +532,15 @@ class SitkaDoeTests(unittest.TestCase):
         self.assertTrue(wolhund.exhausted)
         self.assertEqual(doe.harm, 2)  # Wolhund has presence 2
 
+    def test_spook_test_is_cached_until_id_changes(self):
+        """get_tests should reuse its Action until the card id is reassigned"""
+        doe = SitkaDoe()
+        tests = doe.get_tests()
+        self.assertIs(doe.get_tests(), tests)
+        doe.id = "sitka-doe-reassigned"
+        self.assertEqual(doe.get_tests()[0].id, "test-sitka-doe-reassigned")
+        self.assertEqual(doe.get_tests()[0].target_provider(None), [doe])
+
 
 class SunberryBrambleTests(unittest.TestCase):
     """Tests for Sunberry Bramble card"""